@@ -1,20 +1,215 @@
-import json
+import os
+import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 from scraper.config import get_settings
-from scraper.utils.ids import generate_evidence_id
+from scraper.utils.fs import ensure_dir
 
 settings = get_settings()
 
+# Number of appended lines after which the index is compacted (deduplicated) again.
+COMPACT_AFTER_APPENDS = 1000
+
+# Open SQLite connections keyed by database path.
+_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+
+# (st_mtime_ns, st_size) of the JSONL index each sidecar is known to mirror, keyed by
+# database path; saves the lock and SQLite round trip in sync_evidence_index_db().
+_SYNCED_STATE: Dict[str, Tuple[int, int]] = {}
+
 
 def get_evidence_index_path() -> Path:
     """Get path to evidence index file."""
     index_dir = settings.scraper_cache_dir / "index"
-    index_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(index_dir)
     return index_dir / "evidence_index.jsonl"
 
 
+def get_evidence_index_db_path() -> Path:
+    """Get path to SQLite sidecar of the evidence index (keyed lookups by evidence_id)."""
+    return get_evidence_index_path().with_name("evidence_index.sqlite")
+
+
+def _get_connection() -> sqlite3.Connection:
+    db_path = str(get_evidence_index_db_path())
+    conn = _CONNECTIONS.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Whole entries as orjson blobs, so fields of legacy entries (e.g. snippet_ref) survive
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (evidence_id TEXT PRIMARY KEY, entry BLOB NOT NULL)"
+        )
+        # Single row: the JSONL index state the evidence table was last synced with
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS index_state ("
+            "id INTEGER PRIMARY KEY CHECK (id = 0), mtime_ns INTEGER, size INTEGER)"
+        )
+        _CONNECTIONS[db_path] = conn
+    return conn
+
+
+def _entry_to_row(entry: Dict[str, Any]) -> Tuple[str, bytes]:
+    return (entry["evidence_id"], orjson.dumps(entry))
+
+
+def _upsert_rows(conn: sqlite3.Connection, rows: Iterable[Tuple[str, bytes]]) -> None:
+    conn.executemany("INSERT OR REPLACE INTO entries (evidence_id, entry) VALUES (?, ?)", rows)
+
+
+def upsert_evidence_index_entries(entries: Iterable[Dict[str, Any]]) -> None:
+    """
+    Upsert entries into the SQLite sidecar only, in one transaction.
+
+    Used to persist entries recovered by a cache scan; the JSONL index is not touched.
+    """
+    conn = _get_connection()
+    # The lock also serializes this transaction with update_evidence_index() on the shared connection
+    with _index_lock(), conn:
+        conn.execute("BEGIN")
+        _upsert_rows(conn, (_entry_to_row(e) for e in entries))
+
+
+def _jsonl_state(index_path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = index_path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_synced_state(conn: sqlite3.Connection) -> Optional[Tuple[int, int]]:
+    row = conn.execute("SELECT mtime_ns, size FROM index_state WHERE id = 0").fetchone()
+    return (row[0], row[1]) if row else None
+
+
+def _write_synced_state(conn: sqlite3.Connection, state: Optional[Tuple[int, int]]) -> None:
+    if state is None:
+        conn.execute("DELETE FROM index_state")
+    else:
+        conn.execute("INSERT OR REPLACE INTO index_state (id, mtime_ns, size) VALUES (0, ?, ?)", state)
+    _SYNCED_STATE[str(get_evidence_index_db_path())] = state
+
+
+def _iter_jsonl_entries(index_path: Path) -> Iterator[Dict[str, Any]]:
+    with open(index_path, "rb") as f:
+        for raw in f:
+            if raw == b"\n":
+                continue
+            try:
+                yield orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                continue
+
+
+def sync_evidence_index_db() -> bool:
+    """
+    Make sure the SQLite sidecar mirrors evidence_index.jsonl.
+
+    The sidecar records the JSONL mtime and size it was synced with; when the JSONL was
+    written without it (or by an older version), all JSONL entries are upserted again in
+    one pass. Entries only present in the sidecar (from cache scans) are kept.
+
+    Returns False if there is no JSONL index.
+    """
+    index_path = settings.scraper_cache_dir / "index" / "evidence_index.jsonl"
+    state = _jsonl_state(index_path)
+    if state is None:
+        return False
+    if _SYNCED_STATE.get(str(get_evidence_index_db_path())) == state:
+        return True
+
+    with _index_lock():
+        conn = _get_connection()
+        state = _jsonl_state(index_path)
+        if _read_synced_state(conn) != state:
+            with conn:
+                conn.execute("BEGIN")
+                _upsert_rows(
+                    conn,
+                    (_entry_to_row(e) for e in _iter_jsonl_entries(index_path) if e.get("evidence_id")),
+                )
+                _write_synced_state(conn, state)
+        else:
+            _SYNCED_STATE[str(get_evidence_index_db_path())] = state
+    return True
+
+
+def lookup_evidence_index_entry(evidence_id: str) -> Optional[Dict[str, Any]]:
+    """Look up evidence_id in the evidence index, syncing the SQLite sidecar first if needed."""
+    if not sync_evidence_index_db():
+        return None
+    return get_evidence_index_entry(evidence_id)
+
+
+def get_evidence_index_entry(evidence_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a single evidence index entry by evidence_id (SQLite primary-key lookup)."""
+    row = _get_connection().execute(
+        "SELECT entry FROM entries WHERE evidence_id = ?", (evidence_id,)
+    ).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+
+def dump_to_jsonl(output_path: Path) -> int:
+    """Write all SQLite index entries to output_path as JSONL. Returns the number of entries."""
+    rows = _get_connection().execute("SELECT entry FROM entries ORDER BY evidence_id").fetchall()
+    output_path.write_bytes(b"".join(row[0] + b"\n" for row in rows))
+    return len(rows)
+
+
+def get_evidence_index_meta_path() -> Path:
+    """Get path to evidence index sidecar (tracks appends since last compaction)."""
+    return get_evidence_index_path().with_name("evidence_index.jsonl.meta")
+
+
+@contextmanager
+def _index_lock() -> Iterator[None]:
+    """
+    Hold an exclusive inter-process lock on the evidence index.
+
+    Locks a sidecar file rather than the index itself, since compaction replaces the index file.
+    """
+    lock_path = get_evidence_index_path().with_name("evidence_index.jsonl.lock")
+    with open(lock_path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read_appended_count(meta_path: Path) -> int:
+    if not meta_path.exists():
+        return 0
+    try:
+        return int(orjson.loads(meta_path.read_bytes()).get("appended_since_compaction", 0))
+    except (ValueError, AttributeError):
+        return 0
+
+
+def _write_appended_count(meta_path: Path, count: int) -> None:
+    meta_path.write_bytes(orjson.dumps({"appended_since_compaction": count}))
+
+
 def update_evidence_index(
     evidence_id: str,
     source_kind: str,
@@ -28,15 +223,17 @@ def update_evidence_index(
     params: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
-    Update evidence index with new entry (idempotent: overwrites if exists).
-    
-    Writes to evidence_index.jsonl (JSONL format, one entry per line).
-    
+    Update evidence index with new entry (idempotent: later lines override earlier ones).
+
+    Appends to evidence_index.jsonl (JSONL format, one entry per line). Readers keep the
+    last occurrence per evidence_id; the file is compacted every COMPACT_AFTER_APPENDS appends.
+    The entry is also upserted into the SQLite sidecar used by get_evidence_index_entry().
+
     Note: snippet_ref is no longer stored in evidence index (Evidence is page-level).
     Row-level snippet_refs are stored in EvidenceRef on entities (Person, Mandate, etc.).
     """
     index_path = get_evidence_index_path()
-    
+
     entry = {
         "evidence_id": evidence_id,
         "source_kind": source_kind,
@@ -49,26 +246,59 @@ def update_evidence_index(
         "endpoint": endpoint,
         "params": params,
     }
-    
-    # Load existing index
-    existing = {}
-    if index_path.exists():
-        with open(index_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    e = json.loads(line)
-                    existing[e.get("evidence_id")] = e
-                except json.JSONDecodeError:
-                    continue
-    
-    # Update entry (idempotent: overwrites)
-    existing[evidence_id] = entry
-    
-    # Write back
-    with open(index_path, "w", encoding="utf-8") as f:
-        for e in existing.values():
-            f.write(json.dumps(e, ensure_ascii=False) + "\n")
 
+    with _index_lock():
+        conn = _get_connection()
+        # Only a sidecar that mirrored the JSONL before this write may be marked as synced after it
+        in_sync = _read_synced_state(conn) == _jsonl_state(index_path)
+
+        with open(index_path, "ab") as f:
+            f.write(orjson.dumps(entry) + b"\n")
+
+        _upsert_rows(conn, [_entry_to_row(entry)])
+
+        meta_path = get_evidence_index_meta_path()
+        appended = _read_appended_count(meta_path) + 1
+        if appended >= COMPACT_AFTER_APPENDS:
+            _compact_evidence_index()
+        else:
+            _write_appended_count(meta_path, appended)
+
+        if in_sync:
+            _write_synced_state(conn, _jsonl_state(index_path))
+
+
+def compact_evidence_index() -> None:
+    """
+    Rewrite evidence_index.jsonl keeping only the last entry per evidence_id.
+
+    Writes to evidence_index.jsonl.tmp and atomically replaces the index.
+    """
+    with _index_lock():
+        conn = _get_connection()
+        index_path = get_evidence_index_path()
+        in_sync = _read_synced_state(conn) == _jsonl_state(index_path)
+        _compact_evidence_index()
+        if in_sync:
+            _write_synced_state(conn, _jsonl_state(index_path))
+
+
+def _compact_evidence_index() -> None:
+    """Compact the evidence index; caller must hold _index_lock()."""
+    index_path = get_evidence_index_path()
+    meta_path = get_evidence_index_meta_path()
+
+    if not index_path.exists():
+        _write_appended_count(meta_path, 0)
+        return
+
+    # Load existing index (later lines override earlier ones)
+    existing = {e.get("evidence_id"): e for e in _iter_jsonl_entries(index_path)}
+
+    # Write back in a single write, atomically replacing the index
+    payload = b"".join(orjson.dumps(e) + b"\n" for e in existing.values())
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, index_path)
+
+    _write_appended_count(meta_path, 0)
@@ -1,29 +1,58 @@
 import asyncio
-import json
+import gzip
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-from uuid import uuid4
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import orjson
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+from scraper.cache.evidence_index import update_evidence_index
 from scraper.config import get_settings
-from scraper.mediawiki.client import get_client
+from scraper.mediawiki.client import MediaWikiClient, get_client
 from scraper.mediawiki.types import (
     CachedResponseMetadata,
     LatestCacheManifest,
     MediaWikiParseResponse,
     MediaWikiQueryResponse,
 )
-from scraper.utils.hashing import sha256_hash_json
+from scraper.utils.fs import (
+    RAW_FILENAME,
+    RAW_GZ_FILENAME,
+    ensure_dir,
+    find_raw_path,
+    load_raw_json,
+)
+from scraper.utils.hashing import canonical_json_bytes, sha256_hash
+from scraper.utils.ids import generate_evidence_id
 from scraper.utils.time import utc_now_iso
 
 settings = get_settings()
 SEEDS_FILE = Path("config/seeds.yaml")
 
+# Parsed latest.json manifests keyed on (path, st_mtime_ns).
+_MANIFEST_CACHE: Dict[Tuple[str, int], LatestCacheManifest] = {}
+_MANIFEST_CACHE_MAX = 1024
+# Parsed parse-response metadata.json files keyed on (path, st_mtime_ns, st_size); same bound.
+_METADATA_CACHE: Dict[Tuple[str, int, int], CachedResponseMetadata] = {}
+
+
+_TITLE_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9_-]")
+# ASCII translation table equivalent to _TITLE_UNSAFE_RE.sub("_", ...)
+_TITLE_TRANS = {c: c if chr(c).isalnum() or chr(c) in "_-" else ord("_") for c in range(128)}
+
 
+@lru_cache(maxsize=2048)
 def normalize_title(title: str) -> str:
-    return re.sub(r"[^a-zA-Z0-9_-]", "_", title).strip("_")
+    if title.isascii():
+        return title.translate(_TITLE_TRANS).strip("_")
+    return _TITLE_UNSAFE_RE.sub("_", title).strip("_")
 
 
 def get_cache_path(page_title: str, revision_id: int, endpoint_kind: str) -> Path:
@@ -39,15 +68,38 @@ def get_latest_manifest_path(page_title: str) -> Path:
 
 def get_manifest_path(run_id: str) -> Path:
     manifests_dir = settings.scraper_cache_dir / "manifests"
-    manifests_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(manifests_dir)
     return manifests_dir / f"{run_id}.json"
 
 
+@lru_cache(maxsize=4)
+def _load_seeds_cached(seeds_path: str, mtime_ns: int) -> Dict[str, Any]:
+    with open(seeds_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_latest(latest_path: Path) -> Optional[LatestCacheManifest]:
+    """Load latest.json, reusing the parsed manifest while the file is unchanged."""
+    try:
+        mtime_ns = latest_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    key = (str(latest_path), mtime_ns)
+    latest = _MANIFEST_CACHE.get(key)
+    if latest is None:
+        latest = LatestCacheManifest(**orjson.loads(latest_path.read_bytes()))
+        if len(_MANIFEST_CACHE) >= _MANIFEST_CACHE_MAX:
+            _MANIFEST_CACHE.pop(next(iter(_MANIFEST_CACHE)), None)
+        _MANIFEST_CACHE[key] = latest
+    return latest
+
+
 def load_seeds() -> Dict[str, Any]:
+    """Load seeds.yaml, parsed once per file path and mtime."""
     if not SEEDS_FILE.exists():
         raise FileNotFoundError(f"Seeds file not found: {SEEDS_FILE}")
-    with open(SEEDS_FILE, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return _load_seeds_cached(str(SEEDS_FILE), SEEDS_FILE.stat().st_mtime_ns)
 
 
 def validate_seeds() -> None:
@@ -62,16 +114,16 @@ def validate_seeds() -> None:
         if not isinstance(seed_data, dict):
             raise ValueError(f"Seed {seed_key} must be a dictionary")
 
-        for field in required_fields:
-            if field not in seed_data:
-                raise ValueError(f"Seed {seed_key} missing required field: {field}")
-
-        if seed_data["key"] != seed_key:
-            raise ValueError(f"Seed {seed_key} key mismatch: {seed_data['key']}")
+        missing = required_fields - seed_data.keys()
+        if missing:
+            raise ValueError(f"Seed {seed_key} missing required field: {', '.join(sorted(missing))}")
 
-        if seed_data["key"] in seen_keys:
-            raise ValueError(f"Duplicate seed key: {seed_data['key']}")
-        seen_keys.add(seed_data["key"])
+        key = seed_data["key"]
+        if key in seen_keys:
+            raise ValueError(f"Duplicate seed key: {key}")
+        if key != seed_key:
+            raise ValueError(f"Seed {seed_key} key mismatch: {key}")
+        seen_keys.add(key)
 
         time_range = seed_data["expected_time_range"]
         if not isinstance(time_range, dict) or "start" not in time_range or "end" not in time_range:
@@ -86,37 +138,66 @@ def get_seed(seed_key: str) -> Dict[str, Any]:
 
 
 async def fetch_and_cache_parse(
-    page_title: str, run_id: str, force: bool = False, revalidate: bool = False
+    page_title: str,
+    run_id: str,
+    force: bool = False,
+    revalidate: bool = False,
+    client: Optional[MediaWikiClient] = None,
 ) -> Optional[MediaWikiParseResponse]:
     """Fetch and cache parse response, handling cache hits and revalidation."""
-    client = get_client()
+    client = client or get_client()
+
+    latest_path = get_latest_manifest_path(page_title)
+    response_json: Optional[Dict[str, Any]] = None
+    validators: Dict[str, Optional[str]] = {}
 
     if revalidate:
-        query_response = await client.fetch_query(page_title)
-        query_data = MediaWikiQueryResponse(**extract_query_data(query_response))
-        current_revision = query_data.revision_id
-        if current_revision is None:
-            raise ValueError(f"Could not get revision for {page_title}")
-
-        latest_path = get_latest_manifest_path(page_title)
-        if latest_path.exists():
-            latest = LatestCacheManifest(**json.loads(latest_path.read_text()))
-            if latest.revision_id == current_revision:
+        cached_metadata = get_cached_metadata(page_title)
+        cached_raw_path = (
+            find_raw_path(get_cache_path(page_title, cached_metadata.revision_id, "parse"))
+            if cached_metadata is not None and (cached_metadata.etag or cached_metadata.last_modified)
+            else None
+        )
+        if cached_raw_path is not None:
+            # A conditional GET with the cached response's validators checks whether it is
+            # current and fetches the changed page in the same request
+            response_json, validators = await client.fetch_parse_conditional(
+                page_title,
+                include_sections=True,
+                etag=cached_metadata.etag,
+                last_modified=cached_metadata.last_modified,
+            )
+            if response_json is None:
+                # 304 Not Modified: the cached revision is current
+                latest_path.touch()
+                return load_cached_parse_response(cached_raw_path)
+        else:
+            query_response = await client.fetch_query(page_title)
+            query_data = MediaWikiQueryResponse(**extract_query_data(query_response))
+            current_revision = query_data.revision_id
+            if current_revision is None:
+                raise ValueError(f"Could not get revision for {page_title}")
+
+            latest = _load_latest(latest_path)
+            if latest and latest.revision_id == current_revision:
                 cache_path = get_cache_path(page_title, current_revision, "parse")
-                raw_path = cache_path / "raw.json"
-                if raw_path.exists():
+                raw_path = find_raw_path(cache_path)
+                if raw_path:
                     return load_cached_parse_response(raw_path)
         force = True
 
-    latest_path = get_latest_manifest_path(page_title)
-    if not force and latest_path.exists():
-        latest = LatestCacheManifest(**json.loads(latest_path.read_text()))
+    latest = None if force else _load_latest(latest_path)
+    if latest:
         cache_path = get_cache_path(page_title, latest.revision_id, "parse")
-        raw_path = cache_path / "raw.json"
-        if raw_path.exists():
+        raw_path = find_raw_path(cache_path)
+        if raw_path:
             return load_cached_parse_response(raw_path)
 
-    response_json = await client.fetch_parse(page_title, include_sections=True)
+    if response_json is None:
+        # Unconditional: a forced refetch must get past a bad or stale cache entry
+        response_json, validators = await client.fetch_parse_conditional(page_title, include_sections=True)
+    cached_metadata = get_cached_metadata(page_title)
+
     parse_data = response_json.get("parse", {})
     page_id = parse_data.get("pageid", 0)
     revision_id = parse_data.get("revid", 0)
@@ -124,52 +205,83 @@ async def fetch_and_cache_parse(
     displaytitle = parse_data.get("displaytitle")
 
     cache_path = get_cache_path(page_title, revision_id, "parse")
-    cache_path.mkdir(parents=True, exist_ok=True)
+    ensure_dir(cache_path)
 
-    raw_path = cache_path / "raw.json"
     metadata_path = cache_path / "metadata.json"
 
-    sha256 = sha256_hash_json(response_json)
+    # Serialize once: the canonical bytes are both hashed and written, so
+    # sha256(raw.json) == sha256_hash_json(response_json).
+    raw_bytes = canonical_json_bytes(response_json)
+    sha256 = sha256_hash(raw_bytes)
     retrieved_at = utc_now_iso()
 
-    raw_path.write_text(json.dumps(response_json, ensure_ascii=False, indent=2), encoding="utf-8")
-
-    metadata = CachedResponseMetadata(
-        request_params={"action": "parse", "page": page_title},
-        response_headers={},
-        retrieved_at=retrieved_at,
-        sha256=sha256,
-        url=f"{client.BASE_URL}?action=parse&page={page_title}",
-        page_title=page_title,
-        page_id=page_id,
-        revision_id=revision_id,
-        endpoint_kind="parse",
-    )
-    metadata_path.write_text(metadata.model_dump_json(indent=2), encoding="utf-8")
-
-    latest_manifest = LatestCacheManifest(
-        revision_id=revision_id,
-        retrieved_at=retrieved_at,
-        sha256=sha256,
-        endpoint_kind="parse",
-    )
-    latest_path.write_text(latest_manifest.model_dump_json(indent=2), encoding="utf-8")
+    existing_raw_path = find_raw_path(cache_path)
+    if settings.scraper_cache_compress:
+        raw_path = cache_path / RAW_GZ_FILENAME
+        # mtime=0 keeps the compressed bytes deterministic
+        raw_file_bytes = gzip.compress(raw_bytes, compresslevel=6, mtime=0)
+    else:
+        raw_path = cache_path / RAW_FILENAME
+        raw_file_bytes = raw_bytes
+
+    cached_latest = _load_latest(latest_path)
+    if (
+        cached_latest is not None
+        and cached_latest.revision_id == revision_id
+        and cached_latest.sha256 == sha256
+        and existing_raw_path is not None
+    ):
+        # Content unchanged: skip rewriting the cache files and the evidence index
+        latest_path.touch()
+        if cached_metadata is not None and (
+            (cached_metadata.etag, cached_metadata.last_modified)
+            != (validators.get("etag"), validators.get("last_modified"))
+        ):
+            # ...but keep the validators current for the next conditional request
+            updated = cached_metadata.model_copy(update=validators)
+            await asyncio.to_thread(metadata_path.write_text, updated.model_dump_json(), encoding="utf-8")
+    else:
+        metadata = CachedResponseMetadata(
+            request_params={"action": "parse", "page": page_title},
+            response_headers={},
+            retrieved_at=retrieved_at,
+            sha256=sha256,
+            url=f"{client.BASE_URL}?action=parse&page={page_title}",
+            page_title=page_title,
+            page_id=page_id,
+            revision_id=revision_id,
+            endpoint_kind="parse",
+            etag=validators.get("etag"),
+            last_modified=validators.get("last_modified"),
+        )
+
+        # Write raw.json and metadata.json off the event loop so other fetches keep running.
+        # latest.json is written last: it points readers at this revision.
+        await asyncio.gather(
+            asyncio.to_thread(raw_path.write_bytes, raw_file_bytes),
+            asyncio.to_thread(metadata_path.write_text, metadata.model_dump_json(), encoding="utf-8"),
+        )
+
+        latest_manifest = LatestCacheManifest(
+            revision_id=revision_id,
+            retrieved_at=retrieved_at,
+            sha256=sha256,
+            endpoint_kind="parse",
+        )
+        await asyncio.to_thread(latest_path.write_text, latest_manifest.model_dump_json(), encoding="utf-8")
     
-    # Update evidence index
-    from scraper.cache.evidence_index import update_evidence_index
-    from scraper.utils.ids import generate_evidence_id
-    
-    evidence_id = generate_evidence_id(page_id, revision_id, "parse", sha256)
-    update_evidence_index(
-        evidence_id=evidence_id,
-        source_kind="mediawiki",
-        cache_metadata_path=metadata_path,
-        cache_raw_path=raw_path,
-        page_title=page_title,
-        page_id=page_id,
-        revision_id=revision_id,
-        sha256=sha256,
-    )
+        # Update evidence index
+        evidence_id = generate_evidence_id(page_id, revision_id, "parse", sha256)
+        update_evidence_index(
+            evidence_id=evidence_id,
+            source_kind="mediawiki",
+            cache_metadata_path=metadata_path,
+            cache_raw_path=raw_path,
+            page_title=page_title,
+            page_id=page_id,
+            revision_id=revision_id,
+            sha256=sha256,
+        )
 
     return MediaWikiParseResponse(
         parse=parse_data,
@@ -186,7 +298,7 @@ def extract_query_data(response_json: Dict[str, Any]) -> Dict[str, Any]:
     if not pages:
         raise ValueError("No pages in query response")
 
-    page_data = list(pages.values())[0]
+    page_data = next(iter(pages.values()))
     page_id = page_data.get("pageid", 0)
     revisions = page_data.get("revisions", [])
     revision_id = None
@@ -205,7 +317,7 @@ def extract_query_data(response_json: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def load_cached_parse_response(raw_path: Path) -> MediaWikiParseResponse:
-    response_json = json.loads(raw_path.read_text(encoding="utf-8"))
+    response_json = load_raw_json(raw_path)
     parse_data = response_json.get("parse", {})
     return MediaWikiParseResponse(
         parse=parse_data,
@@ -220,32 +332,47 @@ def load_cached_parse_response(raw_path: Path) -> MediaWikiParseResponse:
 def get_cached_parse_response(seed_key: str) -> Optional[MediaWikiParseResponse]:
     seed = get_seed(seed_key)
     page_title = seed["page_title"]
-    latest_path = get_latest_manifest_path(page_title)
-    if not latest_path.exists():
+    latest = _load_latest(get_latest_manifest_path(page_title))
+    if not latest:
         return None
 
-    latest = LatestCacheManifest(**json.loads(latest_path.read_text()))
     cache_path = get_cache_path(page_title, latest.revision_id, "parse")
-    raw_path = cache_path / "raw.json"
-    if not raw_path.exists():
+    raw_path = find_raw_path(cache_path)
+    if not raw_path:
         return None
 
     return load_cached_parse_response(raw_path)
 
 
 def get_cached_metadata(page_title: str) -> Optional[CachedResponseMetadata]:
-    """Get cached metadata for a page title."""
-    latest_path = get_latest_manifest_path(page_title)
-    if not latest_path.exists():
+    """
+    Get cached metadata for a page title.
+
+    The parsed metadata is reused while metadata.json is unchanged (shared, do not modify).
+    """
+    latest = _load_latest(get_latest_manifest_path(page_title))
+    if not latest:
         return None
 
-    latest = LatestCacheManifest(**json.loads(latest_path.read_text()))
     cache_path = get_cache_path(page_title, latest.revision_id, "parse")
     metadata_path = cache_path / "metadata.json"
-    if not metadata_path.exists():
+    try:
+        st = metadata_path.stat()
+    except FileNotFoundError:
         return None
 
-    metadata_dict = json.loads(metadata_path.read_text())
+    key = (str(metadata_path), st.st_mtime_ns, st.st_size)
+    metadata = _METADATA_CACHE.get(key)
+    if metadata is None:
+        metadata = _load_metadata(metadata_path)
+        if len(_METADATA_CACHE) >= _MANIFEST_CACHE_MAX:
+            _METADATA_CACHE.pop(next(iter(_METADATA_CACHE)), None)
+        _METADATA_CACHE[key] = metadata
+    return metadata
+
+
+def _load_metadata(metadata_path: Path) -> CachedResponseMetadata:
+    metadata_dict = orjson.loads(metadata_path.read_bytes())
     # Handle old cache format that might not have 'url' field
     if "url" not in metadata_dict:
         # Reconstruct URL from page_title if available
@@ -259,14 +386,127 @@ def get_cached_metadata(page_title: str) -> Optional[CachedResponseMetadata]:
     return CachedResponseMetadata(**metadata_dict)
 
 
+async def _fetch_and_close(
+    page_title: str, run_id: str, force: bool, revalidate: bool
+) -> Optional[MediaWikiParseResponse]:
+    async with get_client() as client:
+        return await fetch_and_cache_parse(
+            page_title, run_id, force=force, revalidate=revalidate, client=client
+        )
+
+
 def fetch_legislature_page(seed_key: str, run_id: str, force: bool = False, revalidate: bool = False) -> None:
     seed = get_seed(seed_key)
     page_title = seed["page_title"]
-    response = asyncio.run(fetch_and_cache_parse(page_title, run_id, force=force, revalidate=revalidate))
+    response = asyncio.run(_fetch_and_close(page_title, run_id, force, revalidate))
     if not response:
         raise ValueError(f"Failed to fetch page: {page_title}")
 
 
 def fetch_person_page(page_title: str, run_id: str, force: bool = False, revalidate: bool = False) -> None:
-    asyncio.run(fetch_and_cache_parse(page_title, run_id, force=force, revalidate=revalidate))
-
+    asyncio.run(_fetch_and_close(page_title, run_id, force, revalidate))
+
+
+
+# MediaWiki accepts at most 50 titles per action=query request
+QUERY_BATCH_SIZE = 50
+
+
+async def batch_fetch_revisions(
+    titles: List[str],
+    client: Optional[MediaWikiClient] = None,
+    batch_size: int = QUERY_BATCH_SIZE,
+) -> Dict[str, Optional[int]]:
+    """
+    Get the current revision_id for each title with batched action=query requests.
+
+    Issues ceil(len(titles) / batch_size) requests instead of one per title. Titles
+    that do not exist map to None.
+    """
+    client = client or get_client()
+    batches = [titles[i:i + batch_size] for i in range(0, len(titles), batch_size)]
+    responses = await asyncio.gather(*(client.fetch_query_batch(batch) for batch in batches))
+
+    revisions: Dict[str, Optional[int]] = {}
+    for batch, response in zip(batches, responses, strict=True):
+        query = response.get("query", {})
+        normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+        by_title = {}
+        for page in query.get("pages", {}).values():
+            page_revisions = page.get("revisions") or []
+            by_title[page.get("title")] = page_revisions[0].get("revid") if page_revisions else None
+        for title in batch:
+            revisions[title] = by_title.get(normalized.get(title, title))
+    return revisions
+
+
+async def fetch_pages_async(
+    titles: List[str],
+    run_id: str,
+    force: bool = False,
+    revalidate: bool = False,
+    concurrency: Optional[int] = None,
+    client: Optional[MediaWikiClient] = None,
+) -> List[Union[MediaWikiParseResponse, None, BaseException]]:
+    """
+    Fetch and cache several pages concurrently.
+
+    All fetches share one client (and thus one rate limiter and connection pool); at
+    most `concurrency` are in flight (default: twice SCRAPER_RATE_LIMIT_RPS, so the
+    rate limiter rather than round trips bounds throughput). Returns one result per
+    title, in order; failures are returned as exception objects instead of being raised.
+
+    With revalidate, current revisions are looked up with batch_fetch_revisions() up
+    front instead of one action=query request per title. Titles of a failed batch
+    lookup fall back to revalidating with their own action=query request.
+    """
+    client = client or get_client()
+    if concurrency is None:
+        concurrency = max(1, int(settings.scraper_rate_limit_rps * 2))
+    semaphore = asyncio.Semaphore(concurrency)
+    current_revisions: Dict[str, Optional[int]] = {}
+    if revalidate:
+        batches = [titles[i:i + QUERY_BATCH_SIZE] for i in range(0, len(titles), QUERY_BATCH_SIZE)]
+        lookups = await asyncio.gather(
+            *(batch_fetch_revisions(batch, client=client) for batch in batches),
+            return_exceptions=True,
+        )
+        # A failed batch leaves its titles out; their own revalidation reports any error
+        for lookup in lookups:
+            if not isinstance(lookup, BaseException):
+                current_revisions.update(lookup)
+
+    async def _one(title: str) -> Optional[MediaWikiParseResponse]:
+        async with semaphore:
+            if revalidate and title not in current_revisions:
+                return await fetch_and_cache_parse(
+                    title, run_id, force=force, revalidate=True, client=client
+                )
+            if revalidate:
+                latest = _load_latest(get_latest_manifest_path(title))
+                current = current_revisions.get(title)
+                up_to_date = latest is not None and current is not None and latest.revision_id == current
+                return await fetch_and_cache_parse(
+                    title, run_id, force=force or not up_to_date, client=client
+                )
+            return await fetch_and_cache_parse(title, run_id, force=force, client=client)
+
+    return await asyncio.gather(*[_one(t) for t in titles], return_exceptions=True)
+
+
+def fetch_pages_batch(
+    titles: List[str],
+    run_id: str,
+    force: bool = False,
+    revalidate: bool = False,
+    concurrency: Optional[int] = None,
+) -> List[Union[MediaWikiParseResponse, None, BaseException]]:
+    """Synchronous wrapper around fetch_pages_async() that runs it in its own event loop."""
+    async def _run() -> List[Union[MediaWikiParseResponse, None, BaseException]]:
+        async with get_client() as client:
+            return await fetch_pages_async(
+                titles, run_id, force=force, revalidate=revalidate,
+                concurrency=concurrency, client=client,
+            )
+
+    return asyncio.run(_run())
@@ -0,0 +1,78 @@
+"""
+Command line interface.
+
+Each subcommand lives in its own `_cmd_<name>` module. Only the module of the
+invoked subcommand is imported; `--help` on a subcommand (or an unknown one)
+imports all of them to render the full command list. A bare `scraper --help`
+is answered from a static text without importing Typer at all.
+"""
+
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List, Optional
+
+if TYPE_CHECKING:
+    import typer
+
+# Subcommand name -> one-line help; must match the docstrings of the `run` functions
+COMMANDS = {
+    "seed": "Seed management commands.",
+    "fetch": "Fetch pages from MediaWiki API.",
+    "parse": "Parse fetched pages.",
+    "dip": "DIP API operations.",
+    "reconcile": "Reconcile data sources.",
+    "pipeline": "Run the complete pipeline.",
+    "evidence": "Evidence resolver commands.",
+    "export": "Export data.",
+}
+
+_HELP_STATIC = "\n".join(
+    [
+        "Usage: scraper [OPTIONS] COMMAND [ARGS]...",
+        "",
+        "  Wikipedia Parliament Scraper",
+        "",
+        "Options:",
+        "  --help  Show this message and exit.",
+        "",
+        "Commands:",
+        *(f"  {name:<10} {help_text}" for name, help_text in COMMANDS.items()),
+    ]
+)
+
+
+def _main() -> None:
+    """Wikipedia Parliament Scraper"""
+
+
+def build_app(argv: Optional[List[str]] = None) -> "typer.Typer":
+    """Build the Typer app, registering only the subcommand named in argv if there is one."""
+    import typer
+
+    argv = sys.argv if argv is None else argv
+    requested = argv[1] if len(argv) > 1 else None
+    names = (requested,) if requested in COMMANDS else tuple(COMMANDS)
+
+    app = typer.Typer(help="Wikipedia Parliament Scraper")
+    # An explicit callback keeps subcommand dispatch when only one command is registered
+    app.callback()(_main)
+    for name in names:
+        app.command(name=name)(import_module(f"scraper.cli._cmd_{name}").run)
+    return app
+
+
+def main() -> None:
+    """Console script entry point."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("--help", "-h"):
+        print(_HELP_STATIC)
+        sys.exit(0)
+    build_app()()
+
+
+def __getattr__(name: str) -> Any:
+    # `scraper.cli.app` is built on first access, so importing the package stays cheap
+    if name == "app":
+        app = build_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
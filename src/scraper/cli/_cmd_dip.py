@@ -0,0 +1,38 @@
+import sys
+
+import typer
+from typer import Option
+
+from scraper.cli._common import init_logging
+
+
+def run(
+    ingest: bool = Option(False, "--ingest", help="Ingest DIP persons"),
+    persons: bool = Option(False, "--persons", help="Ingest persons"),
+    from_wp: int | None = Option(None, "--from-wp", help="From Wahlperiode"),
+    to_wp: int | None = Option(None, "--to-wp", help="To Wahlperiode"),
+    detail: bool = Option(False, "--detail", help="Fetch person details"),
+    force: bool = Option(False, "--force", help="Force refetch"),
+) -> None:
+    """DIP API operations."""
+    init_logging()
+    from secrets import token_hex
+
+    from scraper.sources.dip.ingest import ingest_person_list_sync
+
+    if ingest and persons:
+        run_id = token_hex(16)
+        from_wp_val = from_wp or 1
+        to_wp_val = to_wp or 20
+        wahlperiode = list(range(from_wp_val, to_wp_val + 1))
+
+        try:
+            dip_persons = ingest_person_list_sync(wahlperiode, run_id, force=force)
+            typer.echo(f"✓ Ingested {len(dip_persons)} DIP persons for WP {from_wp_val}-{to_wp_val}", err=True)
+            sys.exit(0)
+        except Exception as e:
+            typer.echo(f"✗ DIP ingest failed: {e}", err=True)
+            sys.exit(1)
+    else:
+        typer.echo("Error: Must specify --ingest --persons", err=True)
+        sys.exit(2)
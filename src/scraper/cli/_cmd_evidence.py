@@ -0,0 +1,166 @@
+import functools
+import sys
+from typing import TYPE_CHECKING
+
+import typer
+from typer import Option
+
+from scraper.cli._common import cli_settings, init_logging
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+    from scraper.models.domain import EvidenceRef
+
+
+@functools.lru_cache(maxsize=1)
+def _ref_adapter() -> "TypeAdapter[list[EvidenceRef]]":
+    # Built once per process; kept out of module scope so `--help` does not import pydantic models
+    from pydantic import TypeAdapter
+
+    from scraper.models.domain import EvidenceRef
+
+    return TypeAdapter(list[EvidenceRef])
+
+
+def _validate_evidence_refs(ref_dicts: list) -> "list[EvidenceRef]":
+    """Validate a hit's evidence_refs in one call; on errors keep the valid entries and warn."""
+    from pydantic import ValidationError
+
+    adapter = _ref_adapter()
+    try:
+        return adapter.validate_python(ref_dicts)
+    except ValidationError as e:
+        typer.echo(f"Warning: skipping {e.error_count()} invalid evidence_refs in Meilisearch hit", err=True)
+        valid = []
+        for ref_dict in ref_dicts:
+            try:
+                valid.extend(adapter.validate_python([ref_dict]))
+            except ValidationError:
+                continue
+        return valid
+
+
+def run(
+    resolve: bool = Option(False, "--resolve", help="Resolve evidence IDs"),
+    ids: str | None = Option(None, "--ids", help="Comma-separated evidence IDs"),
+    format: str = Option("json", "--format", help="Output format: json, yaml, md"),
+    with_snippets: bool = Option(False, "--with-snippets", help="Include snippets"),
+    max_len: int = Option(500, "--max-len", help="Maximum snippet length"),
+    prefer: str = Option("table_row", "--prefer", help="Preferred snippet type: table_row or lead_paragraph"),
+    resolve_from_meili: bool = Option(False, "--resolve-from-meili", help="Resolve from Meilisearch query"),
+    query: str | None = Option(None, "--query", help="Meilisearch query string"),
+    index: str = Option("persons", "--index", help="Meilisearch index name"),
+    limit: int = Option(5, "--limit", help="Limit results from Meilisearch"),
+) -> None:
+    """Evidence resolver commands."""
+    init_logging()
+    # Pick the formatter first so an unknown --format fails before any resolving work
+    if format == "json":
+        from scraper.evidence.formatters import format_resolved_evidence_json as format_resolved
+    elif format == "yaml":
+        from scraper.evidence.formatters import format_resolved_evidence_yaml as format_resolved
+    elif format == "md":
+        from scraper.evidence.formatters import format_resolved_evidence_markdown as format_resolved
+    else:
+        typer.echo(f"Error: Unknown format: {format}", err=True)
+        sys.exit(1)
+
+    from scraper.evidence.resolver import EvidenceResolver
+    
+    resolver = EvidenceResolver(backend="file_cache")
+    evidence_ids = []
+    evidence_refs = []
+    
+    if resolve_from_meili:
+        if not query:
+            typer.echo("Error: --query required when using --resolve-from-meili", err=True)
+            sys.exit(1)
+        
+        # Query Meilisearch
+        from scraper.sinks.meili import MeiliSink
+        from scraper.models.domain import EvidenceRef
+        meili = MeiliSink(cli_settings())
+        meili.init()
+        
+        search_index = meili.client.index(index)
+        search_results = search_index.search(query, {"limit": limit})
+        
+        # Prefer evidence_refs (new approach), fallback to evidence_snippet_refs (old format), then evidence_ids (legacy)
+        for hit in search_results.get("hits", []):
+            hit_evidence_refs = hit.get("evidence_refs")
+            hit_evidence_snippet_refs = hit.get("evidence_snippet_refs")
+            if isinstance(hit_evidence_refs, list) and hit_evidence_refs:
+                evidence_refs.extend(_validate_evidence_refs(hit_evidence_refs))
+            elif isinstance(hit_evidence_snippet_refs, dict) and hit_evidence_snippet_refs:
+                # Fallback: evidence_snippet_refs (old format) - convert to EvidenceRef
+                for evidence_id, snippet_ref in hit_evidence_snippet_refs.items():
+                    if snippet_ref and isinstance(snippet_ref, dict):
+                        try:
+                            evidence_ref = EvidenceRef(
+                                evidence_id=evidence_id,
+                                snippet_ref=snippet_ref,
+                                purpose="membership_row" if snippet_ref.get("type") == "table_row" else None,
+                            )
+                            evidence_refs.append(evidence_ref)
+                        except Exception:
+                            pass
+            else:
+                # Final fallback: legacy evidence_ids
+                hit_evidence_ids = hit.get("evidence_ids")
+                if isinstance(hit_evidence_ids, list):
+                    evidence_ids.extend(hit_evidence_ids)
+        
+        # Deduplicate evidence_ids (legacy fallback), keeping Meilisearch ranking order
+        if evidence_ids:
+            evidence_ids = list(dict.fromkeys(evidence_ids))
+            typer.echo(f"Found {len(evidence_ids)} unique evidence IDs from Meilisearch (legacy)", err=True)
+        
+        if evidence_refs:
+            typer.echo(f"Found {len(evidence_refs)} evidence references from Meilisearch", err=True)
+        
+        if not evidence_refs and not evidence_ids:
+            typer.echo(f"No evidence_refs or evidence_ids found in Meilisearch results for query: {query}", err=True)
+            sys.exit(1)
+    
+    elif resolve:
+        if not ids:
+            typer.echo("Error: --ids required when using --resolve", err=True)
+            sys.exit(1)
+        
+        evidence_ids = [eid.strip() for eid in ids.split(",")]
+    
+    else:
+        typer.echo("Error: Must specify --resolve or --resolve-from-meili", err=True)
+        sys.exit(1)
+    
+    if not evidence_refs and not evidence_ids:
+        typer.echo("Error: No evidence references or evidence IDs to resolve", err=True)
+        sys.exit(1)
+    
+    # Validate prefer option (only used for legacy evidence_ids)
+    if prefer not in ["table_row", "lead_paragraph"]:
+        typer.echo(f"Error: --prefer must be 'table_row' or 'lead_paragraph', got: {prefer}", err=True)
+        sys.exit(1)
+    
+    # Resolve evidence: prefer evidence_refs (new approach), fallback to evidence_ids (legacy)
+    resolved = []
+    if evidence_refs:
+        resolved = resolver.resolve_refs(
+            evidence_refs=evidence_refs,
+            with_snippets=with_snippets,
+            snippet_max_len=max_len,
+        )
+    elif evidence_ids:
+        resolved = resolver.resolve(
+            evidence_ids=evidence_ids,
+            with_snippets=with_snippets,
+            snippet_max_len=max_len,
+            prefer_snippet=prefer,
+        )
+    
+    if not resolved:
+        typer.echo(f"Warning: No evidence resolved for {len(evidence_ids)} IDs", err=True)
+        sys.exit(0)  # Exit 0, but warn
+    
+    print(format_resolved(resolved))
@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+import typer
+from typer import Option
+
+from scraper.cli._common import init_logging
+
+
+def run(
+    json: bool = Option(False, "--json", help="Export as JSON"),
+    out: Path | None = Option(None, "--out", help="Output directory"),
+    run_id: str | None = Option(None, "--run-id", help="Run ID to export"),
+) -> None:
+    """Export data."""
+    init_logging()
+    from scraper.sinks.json_export import export_json
+
+    if json and out:
+        try:
+            export_json(output_dir=Path(out), run_id=run_id)
+            typer.echo(f"✓ Exported to {out}", err=True)
+            sys.exit(0)
+        except Exception as e:
+            typer.echo(f"✗ Export failed: {e}", err=True)
+            sys.exit(1)
+    else:
+        typer.echo("Error: Must specify --json --out", err=True)
+        sys.exit(2)
@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+
+import typer
+from typer import Option
+
+from scraper.cli._common import init_logging
+
+
+def run(
+    legislature: bool = Option(False, "--legislature", help="Fetch legislature page"),
+    person: bool = Option(False, "--person", help="Fetch person page"),
+    seed: str | None = Option(None, "--seed", help="Seed key"),
+    title: list[str] | None = Option(None, "--title", help="Wikipedia page title (repeatable)"),
+    titles_file: Path | None = Option(None, "--titles-file", help="File with one page title per line"),
+    force: bool = Option(False, "--force", help="Force refetch, ignore cache"),
+    revalidate: bool = Option(False, "--revalidate", help="Revalidate revision"),
+) -> None:
+    """Fetch pages from MediaWiki API."""
+    init_logging()
+    from secrets import token_hex
+
+    from scraper.cache.mediawiki_cache import fetch_legislature_page, fetch_pages_batch
+
+    run_id = token_hex(16)
+
+    if titles_file:
+        title = list(title or []) + [
+            line.strip() for line in titles_file.read_text(encoding="utf-8").splitlines() if line.strip()
+        ]
+
+    if legislature and seed:
+        try:
+            fetch_legislature_page(seed_key=seed, run_id=run_id, force=force, revalidate=revalidate)
+            typer.echo(f"✓ Fetched legislature for seed: {seed}", err=True)
+            sys.exit(0)
+        except Exception as e:
+            typer.echo(f"✗ Fetch failed: {e}", err=True)
+            sys.exit(1)
+    elif person and title:
+        # All titles are fetched concurrently through one shared client
+        results = fetch_pages_batch(title, run_id=run_id, force=force, revalidate=revalidate)
+        failed = False
+        for page_title, result in zip(title, results, strict=True):
+            if isinstance(result, BaseException):
+                failed = True
+                typer.echo(f"✗ Fetch failed for {page_title}: {result}", err=True)
+            else:
+                typer.echo(f"✓ Fetched person page: {page_title}", err=True)
+        sys.exit(1 if failed else 0)
+    else:
+        typer.echo("Error: Must specify --legislature --seed or --person --title/--titles-file", err=True)
+        sys.exit(2)
@@ -0,0 +1,32 @@
+import sys
+
+import typer
+from typer import Option
+
+from scraper.cli._common import init_logging
+
+
+def run(
+    legislature: bool = Option(False, "--legislature", help="Parse legislature page"),
+    seed: str | None = Option(None, "--seed", help="Seed key"),
+) -> None:
+    """Parse fetched pages."""
+    init_logging()
+    from scraper.cache.mediawiki_cache import get_cached_parse_response
+    from scraper.parsers.legislature_members import parse_legislature_members
+
+    if legislature and seed:
+        try:
+            response = get_cached_parse_response(seed_key=seed)
+            if not response:
+                typer.echo(f"✗ No cached data found for seed: {seed}", err=True)
+                sys.exit(1)
+            result = parse_legislature_members(response, seed_key=seed)
+            typer.echo(f"✓ Parsed {len(result.members)} members", err=True)
+            sys.exit(0)
+        except Exception as e:
+            typer.echo(f"✗ Parse failed: {e}", err=True)
+            sys.exit(1)
+    else:
+        typer.echo("Error: Must specify --legislature --seed", err=True)
+        sys.exit(2)
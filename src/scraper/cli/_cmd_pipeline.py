@@ -0,0 +1,61 @@
+import sys
+
+import typer
+from typer import Option
+
+from scraper.cli._common import cli_settings, init_logging
+
+
+def run(
+    seed: str | None = Option(None, "--seed", help="Seed key (if not provided, runs all)"),
+    write_neo4j: bool = Option(False, "--write-neo4j", help="Write to Neo4j"),
+    write_meili: bool = Option(False, "--write-meili", help="Write to Meilisearch"),
+    force: bool = Option(False, "--force", help="Force refetch"),
+    revalidate: bool = Option(False, "--revalidate", help="Revalidate revisions"),
+    ingest_dip: bool = Option(False, "--ingest-dip", help="Ingest DIP data"),
+    reconcile: bool = Option(False, "--reconcile", help="Reconcile Wikipedia and DIP"),
+    dip_wahlperiode: str | None = Option(None, "--dip-wahlperiode", help="DIP Wahlperiode (comma-separated)"),
+    fetch_person_pages: bool = Option(True, "--fetch-person-pages/--no-fetch-person-pages", help="Fetch individual person pages for intro, birth_date, etc."),
+    concurrency: int | None = Option(None, "--concurrency", help="Seeds processed in parallel when running all (default: 2x rate limit)"),
+    parse_processes: int | None = Option(None, "--parse-processes", help="Worker processes parsing member lists when running all (default: CPU count; 1 disables)"),
+) -> None:
+    """Run the complete pipeline."""
+    init_logging()
+    from scraper.pipeline.run import PipelineRunner
+
+    runner = PipelineRunner(cli_settings())
+
+    dip_wp_list = None
+    if dip_wahlperiode:
+        dip_wp_list = [int(x.strip()) for x in dip_wahlperiode.split(",")]
+
+    try:
+        if seed:
+            success = runner.run_single(
+                seed_key=seed,
+                write_neo4j=write_neo4j,
+                write_meili=write_meili,
+                force=force,
+                revalidate=revalidate,
+                ingest_dip=ingest_dip,
+                reconcile=reconcile,
+                dip_wahlperiode=dip_wp_list,
+                fetch_person_pages=fetch_person_pages,
+            )
+        else:
+            success = runner.run_all(
+                write_neo4j=write_neo4j,
+                write_meili=write_meili,
+                force=force,
+                revalidate=revalidate,
+                ingest_dip=ingest_dip,
+                reconcile=reconcile,
+                dip_wahlperiode=dip_wp_list,
+                fetch_person_pages=fetch_person_pages,
+                concurrency=concurrency,
+                parse_processes=parse_processes,
+            )
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        typer.echo(f"✗ Pipeline failed: {e}", err=True)
+        sys.exit(1)
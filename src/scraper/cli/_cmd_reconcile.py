@@ -0,0 +1,98 @@
+import sys
+
+import typer
+from typer import Option
+
+from scraper.cli._common import cli_settings, init_logging
+
+
+def run(
+    wiki_dip: bool = Option(False, "--wiki-dip", help="Reconcile Wikipedia and DIP"),
+    seed: str | None = Option(None, "--seed", help="Seed key"),
+    use_overrides: bool = Option(True, "--use-overrides/--no-overrides", help="Use link overrides"),
+    write_neo4j: bool = Option(False, "--write-neo4j", help="Write to Neo4j"),
+    write_meili: bool = Option(False, "--write-meili", help="Write to Meilisearch"),
+) -> None:
+    """Reconcile data sources."""
+    init_logging()
+    if wiki_dip and seed:
+        from secrets import token_hex
+
+        from scraper.cache.mediawiki_cache import get_cached_parse_response
+        from scraper.models.domain import WikipediaPersonRecord
+        from scraper.parsers.legislature_members import parse_legislature_members
+        from scraper.reconcile.wiki_dip import reconcile_wiki_dip
+        from scraper.sources.dip.ingest import build_dip_person_records, ingest_person_list_sync
+
+        try:
+            response = get_cached_parse_response(seed_key=seed)
+            if not response:
+                typer.echo(f"✗ No cached Wikipedia data for seed: {seed}", err=True)
+                sys.exit(1)
+
+            legislature_data = parse_legislature_members(response, seed_key=seed)
+
+            # Inputs are already validated models, so records are built without re-validation
+            wiki_records = []
+            for person, _ in legislature_data.members:
+                wiki_record = WikipediaPersonRecord.model_construct(
+                    id=person.id,
+                    wikipedia_title=person.wikipedia_title,
+                    wikipedia_url=person.wikipedia_url,
+                    page_id=0,
+                    revision_id=0,
+                    name=person.name,
+                    birth_date=person.birth_date,
+                    death_date=person.death_date,
+                    intro=person.intro,
+                    evidence_ids=person.evidence_ids,
+                )
+                wiki_records.append(wiki_record)
+
+            run_id = token_hex(16)
+            wahlperiode = [19]
+            dip_persons = ingest_person_list_sync(wahlperiode, run_id, force=False)
+
+            dip_records = build_dip_person_records(dip_persons)
+
+            canonical_persons, assertions = reconcile_wiki_dip(
+                wiki_records, dip_records, use_overrides=use_overrides
+            )
+
+            accepted = sum(1 for a in assertions if a.status == "accepted")
+            pending = sum(1 for a in assertions if a.status == "pending")
+            rejected = sum(1 for a in assertions if a.status == "rejected")
+
+            typer.echo(
+                "✓ Reconciliation complete:\n"
+                f"  Accepted: {accepted}\n"
+                f"  Pending: {pending}\n"
+                f"  Rejected: {rejected}\n"
+                f"  Canonical persons: {len(canonical_persons)}",
+                err=True,
+            )
+
+            if write_neo4j or write_meili:
+                normalized = {
+                    "canonical_persons": canonical_persons,
+                    "link_assertions": assertions,
+                    "dip_person_records": dip_records,
+                }
+                if write_neo4j:
+                    from scraper.sinks.neo4j import Neo4jSink
+                    sink = Neo4jSink(cli_settings())
+                    sink.init()
+                    sink.upsert_reconciliation(normalized)
+                if write_meili:
+                    from scraper.sinks.meili import MeiliSink
+                    sink = MeiliSink(cli_settings())
+                    sink.init()
+                    sink.upsert_reconciliation(normalized)
+
+            sys.exit(0)
+        except Exception as e:
+            typer.echo(f"✗ Reconciliation failed: {e}", err=True)
+            sys.exit(1)
+    else:
+        typer.echo("Error: Must specify --wiki-dip --seed", err=True)
+        sys.exit(2)
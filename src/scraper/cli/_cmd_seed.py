@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+import typer
+from typer import Option
+
+from scraper.cli._common import init_logging
+
+
+def run(
+    validate: bool = Option(False, "--validate", help="Validate seed configuration"),
+    discover: bool = Option(False, "--discover", help="Discover seeds for landtage"),
+    landtage: bool = Option(False, "--landtage", help="Discover landtage seeds"),
+    registry: Path | None = Option(None, "--registry", help="Path to landtage registry"),
+    output: Path | None = Option(None, "--output", help="Output path for discovered seeds"),
+    pin_revisions: bool = Option(True, "--pin-revisions/--no-pin-revisions", help="Pin page_id and revision_id in seeds"),
+    force: bool = Option(False, "--force", help="Force refetch, ignore cache"),
+) -> None:
+    """Seed management commands."""
+    init_logging()
+    if discover or landtage:
+        import asyncio
+        from scraper.seeds.discover_landtage import discover_landtage_seeds
+
+        try:
+            typer.echo("Discovering landtage seeds...", err=True)
+            manifest = asyncio.run(
+                discover_landtage_seeds(
+                    registry_path=registry,
+                    output_path=output,
+                    pin_revisions=pin_revisions,
+                    force=force,
+                )
+            )
+            
+            # One write for the whole summary
+            summary = [
+                "✓ Discovery complete:",
+                f"  Found: {len(manifest['found_titles'])} titles",
+                f"  Validated: {len(manifest['validated'])} seeds",
+                f"  Rejected: {len(manifest['rejected'])} titles",
+                f"  Output: {manifest['output_file']}",
+            ]
+            if manifest["errors"]:
+                summary.append(f"  Errors: {len(manifest['errors'])}")
+            typer.echo("\n".join(summary), err=True)
+            
+            sys.exit(0)
+        except Exception as e:
+            typer.echo(f"✗ Discovery failed: {e}", err=True)
+            sys.exit(1)
+    elif validate:
+        from scraper.cache.mediawiki_cache import validate_seeds
+
+        try:
+            validate_seeds()
+            typer.echo("✓ Seeds validation passed", err=True)
+            sys.exit(0)
+        except Exception as e:
+            typer.echo(f"✗ Seeds validation failed: {e}", err=True)
+            sys.exit(2)
+    else:
+        typer.echo("Error: Must specify --validate or --discover --landtage", err=True)
+        sys.exit(2)
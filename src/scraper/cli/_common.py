@@ -0,0 +1,21 @@
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scraper.config import Settings
+
+
+# Settings and logging are set up on first use inside a command, so `--help`
+# does not read .env or configure logging.
+@functools.lru_cache(maxsize=1)
+def cli_settings() -> "Settings":
+    from scraper.config import get_settings
+
+    return get_settings()
+
+
+@functools.lru_cache(maxsize=1)
+def init_logging() -> None:
+    from scraper.logging import setup_logging
+
+    setup_logging()
@@ -1,10 +1,12 @@
-import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from scraper.utils.fs import ensure_dir
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", case_sensitive=False)
@@ -22,7 +24,10 @@ class Settings(BaseSettings):
     )
 
     scraper_rate_limit_rps: float = Field(default=2.0, alias="SCRAPER_RATE_LIMIT_RPS")
+    # Requests that may be sent back to back before SCRAPER_RATE_LIMIT_RPS spacing applies
+    scraper_rate_limit_burst: float = Field(default=1.0, alias="SCRAPER_RATE_LIMIT_BURST")
     scraper_cache_dir: Path = Field(default=Path("/data/cache"), alias="SCRAPER_CACHE_DIR")
+    scraper_cache_compress: bool = Field(default=False, alias="SCRAPER_CACHE_COMPRESS")
     scraper_export_dir: Path = Field(default=Path("/data/exports"), alias="SCRAPER_EXPORT_DIR")
     scraper_registry_path: Path = Field(default=Path("/app/config/landtage_registry.yaml"), alias="SCRAPER_REGISTRY_PATH")
     scraper_seeds_landtage_path: Path = Field(default=Path("/data/exports/seeds_landtage.yaml"), alias="SCRAPER_SEEDS_LANDTAGE_PATH")
@@ -33,16 +38,18 @@ class Settings(BaseSettings):
     )
     dip_max_wahlperiode: int = Field(default=50, alias="DIP_MAX_WAHLPERIODE")
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.scraper_cache_dir = Path(self.scraper_cache_dir)
-        self.scraper_export_dir = Path(self.scraper_export_dir)
-        self.scraper_registry_path = Path(self.scraper_registry_path)
-        self.scraper_seeds_landtage_path = Path(self.scraper_seeds_landtage_path)
-        self.scraper_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.scraper_export_dir.mkdir(parents=True, exist_ok=True)
+    # Directories are created on first access rather than on construction
+    @property
+    def cache_dir(self) -> Path:
+        return ensure_dir(self.scraper_cache_dir)
+
+    @property
+    def export_dir(self) -> Path:
+        return ensure_dir(self.scraper_export_dir)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Return the process-wide Settings instance (.env is read once)."""
     return Settings()
 
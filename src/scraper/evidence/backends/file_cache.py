@@ -1,95 +1,120 @@
-import json
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import orjson
+from lxml import etree
 
 from scraper.config import get_settings
 from scraper.evidence.types import ResolvedEvidence
-from scraper.evidence.snippets import extract_snippet
+from scraper.evidence.snippets import extract_snippet, normalize_snippet_ref, parse_html
+from scraper.utils.fs import find_raw_path, load_raw_json
 from scraper.utils.url import build_wikipedia_canonical_url, build_dip_canonical_url
 
 settings = get_settings()
 
+# Parsed evidence index keyed on (path, st_mtime_ns, st_size); holds the latest version only
+_INDEX_CACHE: Dict[Tuple[str, int, int], Dict[str, Dict[str, Any]]] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+
+# Cache directories already scanned (and persisted to the index sidecar) in this process
+_SCANNED_CACHE_DIRS: Set[str] = set()
+# Serializes cache scans, so concurrent resolver threads scan a directory only once
+_SCAN_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _load_parsed_html(raw_path: str, mtime_ns: int) -> Optional[etree._Element]:
+    """
+    Load a cached MediaWiki raw response and parse its HTML body into a tree.
+
+    Keyed on path and mtime: refs resolved in one batch mostly point at the same few
+    pages (e.g. every membership row of one member list), which then are parsed once.
+    """
+    raw_data = load_raw_json(Path(raw_path))
+    return parse_html(raw_data.get("parse", {}).get("text", {}).get("*", ""))
+
 
 def load_evidence_index() -> Dict[str, Dict[str, any]]:
     """
     Load evidence index from /data/cache/index/evidence_index.jsonl
     
-    Returns: dict mapping evidence_id -> index entry
+    The index is append-only: later lines override earlier ones for the same evidence_id.
+    The parsed index is reused until the file's mtime or size changes.
+    
+    Returns: dict mapping evidence_id -> index entry (shared, do not modify)
     """
     index_path = settings.scraper_cache_dir / "index" / "evidence_index.jsonl"
     
-    if not index_path.exists():
+    try:
+        st = index_path.stat()
+    except FileNotFoundError:
         return {}
+    key = (str(index_path), st.st_mtime_ns, st.st_size)
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None:
+        return cached
     
     index = {}
-    with open(index_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
+    # orjson parses raw bytes directly and tolerates the trailing newline
+    with open(index_path, "rb") as f:
+        for raw in f:
+            if raw == b"\n":
                 continue
             try:
-                entry = json.loads(line)
+                entry = orjson.loads(raw)
                 evidence_id = entry.get("evidence_id")
                 if evidence_id:
                     index[evidence_id] = entry
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 continue
     
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE.clear()
+        _INDEX_CACHE[key] = index
     return index
 
 
-def scan_cache_for_evidence_id(evidence_id: str) -> Optional[Dict[str, any]]:
-    """
-    Best-effort scan of cache to find evidence_id.
-    This is slow and should only be used as fallback when index lookup fails.
-    """
-    from scraper.config import get_settings
+def _scan_mediawiki_cache(cache_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Yield an index entry for every cached parse response under cache_dir."""
     from scraper.utils.ids import generate_evidence_id
     from scraper.utils.hashing import sha256_hash_json
-    
-    settings = get_settings()
-    cache_dir = settings.scraper_cache_dir / "mediawiki"
-    
-    if not cache_dir.exists():
-        return None
-    
-    # Scan mediawiki cache directories
-    for page_dir in cache_dir.iterdir():
-        if not page_dir.is_dir():
-            continue
-        
-        for revision_dir in page_dir.iterdir():
-            if not revision_dir.is_dir():
-                continue
-            
-            parse_dir = revision_dir / "parse"
-            if not parse_dir.exists():
-                continue
-            
-            metadata_path = parse_dir / "metadata.json"
-            raw_path = parse_dir / "raw.json"
-            
-            if not metadata_path.exists() or not raw_path.exists():
+
+    # os.scandir exposes the entry type from the directory listing, saving a stat per entry
+    with os.scandir(cache_dir) as page_dirs:
+        for page_dir in page_dirs:
+            if not page_dir.is_dir(follow_symlinks=False):
                 continue
-            
-            try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
-                
-                with open(raw_path, "r", encoding="utf-8") as rf:
-                    raw_data = json.load(rf)
-                
-                page_id = metadata.get("page_id", 0)
-                revision_id = metadata.get("revision_id", 0)
-                
-                # Always compute sha256 from raw data for consistency
-                sha256 = sha256_hash_json(raw_data)
-                
-                # Generate evidence_id and check if it matches
-                computed_id = generate_evidence_id(page_id, revision_id, "parse", sha256)
-                if computed_id == evidence_id:
-                    return {
-                        "evidence_id": evidence_id,
+
+            with os.scandir(page_dir.path) as revision_dirs:
+                for revision_dir in revision_dirs:
+                    if not revision_dir.is_dir(follow_symlinks=False):
+                        continue
+
+                    parse_dir = Path(revision_dir.path) / "parse"
+                    metadata_path = parse_dir / "metadata.json"
+                    raw_path = find_raw_path(parse_dir)
+
+                    if raw_path is None or not metadata_path.exists():
+                        continue
+
+                    try:
+                        metadata = orjson.loads(metadata_path.read_bytes())
+                        page_id = metadata.get("page_id", 0)
+                        revision_id = metadata.get("revision_id", 0)
+
+                        # metadata.json records the sha256 the evidence_id was generated from;
+                        # only hash the raw data for metadata written without it
+                        sha256 = metadata.get("sha256")
+                        if not sha256:
+                            sha256 = sha256_hash_json(load_raw_json(raw_path))
+                    except (IOError, orjson.JSONDecodeError, KeyError):
+                        continue
+
+                    yield {
+                        "evidence_id": generate_evidence_id(page_id, revision_id, "parse", sha256),
                         "source_kind": "mediawiki",
                         "cache_metadata_path": str(metadata_path),
                         "cache_raw_path": str(raw_path),
@@ -98,10 +123,49 @@ def scan_cache_for_evidence_id(evidence_id: str) -> Optional[Dict[str, any]]:
                         "revision_id": revision_id,
                         "sha256": sha256,
                     }
-            except (IOError, json.JSONDecodeError, KeyError) as e:
-                continue
-    
-    return None
+
+
+def scan_cache_for_evidence_id(evidence_id: str) -> Optional[Dict[str, any]]:
+    """
+    Best-effort scan of cache to find evidence_id.
+    This is slow and should only be used as fallback when index lookup fails.
+
+    The first scan of a cache directory stores every entry it finds in the SQLite
+    sidecar of the evidence index, so later misses are a single keyed lookup.
+    """
+    from scraper.cache.evidence_index import (
+        get_evidence_index_db_path,
+        get_evidence_index_entry,
+        upsert_evidence_index_entries,
+    )
+
+    cache_dir = settings.scraper_cache_dir / "mediawiki"
+
+    if not cache_dir.exists():
+        return None
+
+    if get_evidence_index_db_path().exists():
+        entry = get_evidence_index_entry(evidence_id)
+        if entry:
+            return entry
+
+    with _SCAN_LOCK:
+        if str(cache_dir) in _SCANNED_CACHE_DIRS:
+            # Scanned already (possibly by another thread while this one waited)
+            return get_evidence_index_entry(evidence_id)
+
+        entries = list(_scan_mediawiki_cache(cache_dir))
+        upsert_evidence_index_entries(entries)
+        _SCANNED_CACHE_DIRS.add(str(cache_dir))
+
+    return next((e for e in entries if e["evidence_id"] == evidence_id), None)
+
+
+def _uses_page(snippet_ref: Any, prefer_snippet: str) -> bool:
+    """Whether extract_snippet() looks at the page at all for this snippet_ref/preference."""
+    if isinstance(snippet_ref, dict) and snippet_ref.get("type") == "table_row":
+        return True
+    return prefer_snippet == "lead_paragraph" or (prefer_snippet == "table_row" and not snippet_ref)
 
 
 def resolve_from_file_cache(
@@ -111,45 +175,72 @@ def resolve_from_file_cache(
     prefer_snippet: str = "table_row",
     snippet_ref: Optional[Dict[str, Any]] = None,  # Row-level snippet_ref from EvidenceRef
     purpose: Optional[str] = None,  # Purpose from EvidenceRef
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Optional[ResolvedEvidence]:
     """
     Resolve evidence from file cache using evidence index.
     Falls back to cache scan if not found in index.
+
+    The entry is looked up in the SQLite sidecar of the index, unless an `index` dict
+    (from load_evidence_index()) is passed.
+    """
+    return resolve_refs_from_file_cache(
+        evidence_id,
+        [(snippet_ref, purpose, prefer_snippet)],
+        with_snippet=with_snippet,
+        snippet_max_len=snippet_max_len,
+        index=index,
+    )[0]
+
+
+def resolve_refs_from_file_cache(
+    evidence_id: str,
+    refs: List[Tuple[Optional[Dict[str, Any]], Optional[str], str]],
+    with_snippet: bool = False,
+    snippet_max_len: int = 500,
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[Optional[ResolvedEvidence]]:
     """
-    index = load_evidence_index()
-    entry = index.get(evidence_id)
+    Resolve several references to the same evidence_id.
+
+    refs holds (snippet_ref, purpose, prefer_snippet) per reference. Index lookup,
+    metadata, canonical URL and the parsed page are loaded once for the whole group;
+    only the snippet is extracted per reference.
+
+    Returns one ResolvedEvidence per ref, or Nones if the evidence_id is not found.
+    """
+    not_found: List[Optional[ResolvedEvidence]] = [None] * len(refs)
+
+    if index is None:
+        from scraper.cache.evidence_index import lookup_evidence_index_entry
+
+        entry = lookup_evidence_index_entry(evidence_id)
+    else:
+        entry = index.get(evidence_id)
     
     if not entry:
         # Fallback: best-effort cache scan (slow, but works for old data)
         entry = scan_cache_for_evidence_id(evidence_id)
         if not entry:
-            return None
+            return not_found
     
     source_kind = entry.get("source_kind", "other")
     cache_metadata_path = entry.get("cache_metadata_path")
     cache_raw_path = entry.get("cache_raw_path")
     
-    if not cache_metadata_path or not Path(cache_metadata_path).exists():
-        return None
+    if not cache_metadata_path:
+        return not_found
     
-    # Load metadata
+    # Load metadata (a missing file is an OSError, no separate exists() check)
     try:
-        with open(cache_metadata_path, "r", encoding="utf-8") as f:
-            metadata = json.load(f)
-    except (IOError, json.JSONDecodeError):
-        return None
+        metadata = orjson.loads(Path(cache_metadata_path).read_bytes())
+    except (IOError, orjson.JSONDecodeError):
+        return not_found
     
     page_title = entry.get("page_title") or metadata.get("page_title")
-    page_id = entry.get("page_id") or metadata.get("page_id")
     revision_id = entry.get("revision_id") or metadata.get("revision_id")
-    retrieved_at_utc = metadata.get("retrieved_at")
-    sha256 = entry.get("sha256") or metadata.get("sha256")
     source_url = metadata.get("url")
     
-    # Use snippet_ref from parameter (EvidenceRef) if provided, otherwise fallback to legacy entry
-    # Note: Evidence index no longer stores snippet_ref (page-level), but legacy entries may have it
-    effective_snippet_ref = snippet_ref if snippet_ref is not None else entry.get("snippet_ref")
-    
     # Build canonical URL
     if source_kind == "mediawiki":
         canonical_url = build_wikipedia_canonical_url(page_title or "", revision_id)
@@ -160,38 +251,61 @@ def resolve_from_file_cache(
     else:
         canonical_url = source_url or ""
     
-    # Extract snippet if requested
-    snippet = None
-    snippet_source = None
-    if with_snippet and cache_raw_path and Path(cache_raw_path).exists():
-        try:
-            with open(cache_raw_path, "r", encoding="utf-8") as f:
-                raw_data = json.load(f)
-            
+    shared = {
+        "evidence_id": evidence_id,
+        "source_kind": source_kind,
+        "page_title": page_title,
+        "page_id": entry.get("page_id") or metadata.get("page_id"),
+        "revision_id": revision_id,
+        "retrieved_at_utc": metadata.get("retrieved_at"),
+        "sha256": entry.get("sha256") or metadata.get("sha256"),
+        "source_url": source_url,
+        "canonical_url": canonical_url,
+        "cache_metadata_path": str(cache_metadata_path) if cache_metadata_path else None,
+        "cache_raw_path": str(cache_raw_path) if cache_raw_path else None,
+    }
+    
+    # The page is loaded on first use, and only if a ref's snippet actually needs it
+    page: List[Optional[etree._Element]] = []
+    
+    def load_page() -> Optional[etree._Element]:
+        if not page:
             html = None
-            if source_kind == "mediawiki":
-                html = raw_data.get("parse", {}).get("text", {}).get("*", "")
-            
-            # snippet_ref can be Dict (new format) or string (legacy)
-            snippet, snippet_source = extract_snippet(html, effective_snippet_ref, snippet_max_len, prefer=prefer_snippet)
-        except (IOError, json.JSONDecodeError, KeyError):
-            pass
-    
-    return ResolvedEvidence(
-        evidence_id=evidence_id,
-        source_kind=source_kind,
-        page_title=page_title,
-        page_id=page_id,
-        revision_id=revision_id,
-        retrieved_at_utc=retrieved_at_utc,
-        sha256=sha256,
-        source_url=source_url,
-        canonical_url=canonical_url,
-        cache_metadata_path=str(cache_metadata_path) if cache_metadata_path else None,
-        cache_raw_path=str(cache_raw_path) if cache_raw_path else None,
-        snippet=snippet,
-        snippet_source=snippet_source,
-        snippet_ref=effective_snippet_ref,  # From EvidenceRef (parameter) or legacy entry
-        purpose=purpose,  # From EvidenceRef
-    )
-
+            # Only MediaWiki pages carry HTML to extract snippets from
+            if source_kind == "mediawiki" and cache_raw_path:
+                try:
+                    mtime_ns = Path(cache_raw_path).stat().st_mtime_ns
+                    html = _load_parsed_html(str(cache_raw_path), mtime_ns)
+                except (IOError, orjson.JSONDecodeError, KeyError):
+                    pass
+            page.append(html)
+        return page[0]
+    
+    # Validate the shared fields once; per-ref instances only add snippet fields on top
+    validated = ResolvedEvidence(**shared).__dict__
+    construct = ResolvedEvidence.model_construct
+    # Note: Evidence index no longer stores snippet_ref (page-level), but legacy entries may have it
+    legacy_snippet_ref = normalize_snippet_ref(entry.get("snippet_ref"))
+    
+    resolved: List[Optional[ResolvedEvidence]] = []
+    for snippet_ref, purpose, prefer_snippet in refs:
+        # Use snippet_ref from parameter (EvidenceRef) if provided, otherwise fallback to legacy entry
+        effective_snippet_ref = snippet_ref if snippet_ref is not None else legacy_snippet_ref
+        
+        # Extract snippet if requested
+        snippet = None
+        snippet_source = None
+        if with_snippet and _uses_page(effective_snippet_ref, prefer_snippet):
+            html = load_page()
+            if html is not None:
+                snippet, snippet_source = extract_snippet(html, effective_snippet_ref, snippet_max_len, prefer=prefer_snippet)
+        
+        resolved.append(construct(**{
+            **validated,
+            "snippet": snippet,
+            "snippet_source": snippet_source,
+            "snippet_ref": effective_snippet_ref,  # From EvidenceRef (parameter) or legacy entry
+            "purpose": purpose,  # From EvidenceRef
+        }))
+    
+    return resolved
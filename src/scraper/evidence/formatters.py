@@ -1,53 +1,63 @@
 import json
-from typing import List
+from typing import Any, Dict, List
 
-import yaml
+import orjson
 
 from scraper.evidence.types import ResolvedEvidence
 
 
+def _dump(e: ResolvedEvidence) -> Dict[str, Any]:
+    """Set fields of e as a plain dict (ResolvedEvidence holds only scalars and plain dicts)."""
+    return {k: v for k, v in e.__dict__.items() if v is not None}
+
+
 def format_resolved_evidence_json(resolved: List[ResolvedEvidence]) -> str:
     """Format resolved evidence as JSON."""
-    return json.dumps(
-        [e.model_dump(exclude_none=True) for e in resolved],
-        indent=2,
-        ensure_ascii=False,
-    )
+    return orjson.dumps(
+        [_dump(e) for e in resolved],
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ).decode()
 
 
 def format_resolved_evidence_yaml(resolved: List[ResolvedEvidence]) -> str:
     """Format resolved evidence as YAML."""
-    data = [e.model_dump(exclude_none=True) for e in resolved]
-    return yaml.dump(data, allow_unicode=True, default_flow_style=False)
+    import yaml
+
+    # The C dumper needs libyaml; fall back to the pure-Python one without it
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    data = [_dump(e) for e in resolved]
+    return yaml.dump(data, Dumper=dumper, allow_unicode=True, default_flow_style=False)
+
+
+# (attribute, line template, always shown) in output order; lines of unset attributes
+# are skipped unless always shown
+_MD_FIELDS = (
+    ("page_title", "  - **Page**: {}", False),
+    ("revision_id", "  - **Revision**: {}", False),
+    ("canonical_url", "  - **URL**: {}", True),
+    ("retrieved_at_utc", "  - **Retrieved**: {}", False),
+    ("sha256", "  - **SHA256**: `{:.16}...`", False),
+    ("snippet", "  - **Snippet**: \"{}\"", False),
+    ("snippet_source", "  - **Snippet Source**: {}", False),
+    ("purpose", "  - **Purpose**: {}", False),
+)
 
 
 def format_resolved_evidence_markdown(resolved: List[ResolvedEvidence]) -> str:
     """Format resolved evidence as Markdown."""
-    lines = []
+    lines: List[str] = []
+    append = lines.append
     
     for e in resolved:
-        lines.append(f"- Evidence `{e.evidence_id}`")
-        lines.append(f"  - **Source**: {e.source_kind}")
-        if e.page_title:
-            lines.append(f"  - **Page**: {e.page_title}")
-        if e.revision_id:
-            lines.append(f"  - **Revision**: {e.revision_id}")
-        lines.append(f"  - **URL**: {e.canonical_url}")
-        if e.retrieved_at_utc:
-            lines.append(f"  - **Retrieved**: {e.retrieved_at_utc}")
-        if e.sha256:
-            lines.append(f"  - **SHA256**: `{e.sha256[:16]}...`")
-        if e.snippet:
-            lines.append(f"  - **Snippet**: \"{e.snippet}\"")
-        if e.snippet_source:
-            lines.append(f"  - **Snippet Source**: {e.snippet_source}")
-        if e.purpose:
-            lines.append(f"  - **Purpose**: {e.purpose}")
+        append(f"- Evidence `{e.evidence_id}`")
+        append(f"  - **Source**: {e.source_kind}")
+        for attr, template, always in _MD_FIELDS:
+            value = getattr(e, attr)
+            if value or always:
+                append(template.format(value))
         if e.snippet_ref:
-            import json
             snippet_ref_str = json.dumps(e.snippet_ref, ensure_ascii=False, indent=4)
-            lines.append(f"  - **Snippet Ref**: ```json\n{snippet_ref_str}\n```")
-        lines.append("")
+            append(f"  - **Snippet Ref**: ```json\n{snippet_ref_str}\n```")
+        append("")
     
     return "\n".join(lines)
-
@@ -1,12 +1,21 @@
-from typing import List, Optional
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, TypeVar
 
 from scraper.config import get_settings
-from scraper.evidence.backends.file_cache import resolve_from_file_cache
+from scraper.evidence.backends.file_cache import (
+    resolve_from_file_cache,
+    resolve_refs_from_file_cache,
+)
 from scraper.evidence.types import ResolvedEvidence
 from scraper.models.domain import EvidenceRef
 
 settings = get_settings()
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class EvidenceResolver:
     """
@@ -14,10 +23,22 @@ class EvidenceResolver:
     
     Primary backend: file-based cache (offline, deterministic)
     Optional backends: Neo4j, exports (can be added later)
+
+    Evidence is resolved on up to max_workers threads (default: CPU count): the work
+    is mostly file reads and orjson/lxml parsing, which release the GIL.
     """
     
-    def __init__(self, backend: str = "file_cache"):
+    def __init__(self, backend: str = "file_cache", max_workers: Optional[int] = None):
         self.backend = backend
+        self.max_workers = max_workers or os.cpu_count() or 1
+    
+    def _map(self, fn: Callable[[T], R], items: List[T]) -> List[R]:
+        """Apply fn to items, keeping their order; uses a thread pool for more than one item."""
+        workers = min(self.max_workers, len(items))
+        if workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, items))
     
     def resolve(
         self,
@@ -40,26 +61,21 @@ class EvidenceResolver:
         Returns:
             List of ResolvedEvidence objects (may be shorter than input if some IDs not found)
         """
-        resolved = []
+        if self.backend != "file_cache":
+            # Future: Neo4j, exports backends
+            return []
         
-        for evidence_id in evidence_ids:
-            if self.backend == "file_cache":
-                resolved_evidence = resolve_from_file_cache(
-                    evidence_id=evidence_id,
-                    with_snippet=with_snippets,
-                    snippet_max_len=snippet_max_len,
-                    prefer_snippet="lead_paragraph",  # Legacy: no snippet_ref, use lead_paragraph
-                    snippet_ref=None,  # No row-level reference
-                    purpose=None,
-                )
-            else:
-                # Future: Neo4j, exports backends
-                resolved_evidence = None
-            
-            if resolved_evidence:
-                resolved.append(resolved_evidence)
+        def resolve_one(evidence_id: str) -> Optional[ResolvedEvidence]:
+            return resolve_from_file_cache(
+                evidence_id=evidence_id,
+                with_snippet=with_snippets,
+                snippet_max_len=snippet_max_len,
+                prefer_snippet="lead_paragraph",  # Legacy: no snippet_ref, use lead_paragraph
+                snippet_ref=None,  # No row-level reference
+                purpose=None,
+            )
         
-        return resolved
+        return [r for r in self._map(resolve_one, evidence_ids) if r]
     
     def resolve_refs(
         self,
@@ -80,29 +96,38 @@ class EvidenceResolver:
         Returns:
             List of ResolvedEvidence objects (may be shorter than input if some IDs not found)
         """
-        resolved = []
+        if self.backend != "file_cache":
+            # Future: Neo4j, exports backends
+            return []
+        
+        # Group refs by evidence_id so each page is loaded once, keeping the input order
+        positions: Dict[str, List[int]] = defaultdict(list)
+        for i, evidence_ref in enumerate(evidence_refs):
+            positions[evidence_ref.evidence_id].append(i)
         
-        for evidence_ref in evidence_refs:
-            if self.backend == "file_cache":
+        def resolve_group(evidence_id: str) -> List[Optional[ResolvedEvidence]]:
+            refs = []
+            for i in positions[evidence_id]:
+                evidence_ref = evidence_refs[i]
                 # Prefer table_row if snippet_ref is available, otherwise lead_paragraph
                 prefer_snippet = "table_row" if evidence_ref.snippet_ref and evidence_ref.snippet_ref.get("type") == "table_row" else "lead_paragraph"
-                
-                resolved_evidence = resolve_from_file_cache(
-                    evidence_id=evidence_ref.evidence_id,
-                    with_snippet=with_snippets,
-                    snippet_max_len=snippet_max_len,
-                    prefer_snippet=prefer_snippet,
-                    snippet_ref=evidence_ref.snippet_ref,  # Row-level reference from EvidenceRef
-                    purpose=evidence_ref.purpose,
-                )
-            else:
-                # Future: Neo4j, exports backends
-                resolved_evidence = None
+                # Row-level reference and purpose from EvidenceRef
+                refs.append((evidence_ref.snippet_ref, evidence_ref.purpose, prefer_snippet))
             
-            if resolved_evidence:
-                resolved.append(resolved_evidence)
+            return resolve_refs_from_file_cache(
+                evidence_id,
+                refs,
+                with_snippet=with_snippets,
+                snippet_max_len=snippet_max_len,
+            )
+        
+        evidence_ids = list(positions)
+        resolved: List[Optional[ResolvedEvidence]] = [None] * len(evidence_refs)
+        for evidence_id, group_resolved in zip(evidence_ids, self._map(resolve_group, evidence_ids), strict=True):
+            for i, resolved_evidence in zip(positions[evidence_id], group_resolved, strict=True):
+                resolved[i] = resolved_evidence
         
-        return resolved
+        return [r for r in resolved if r]
     
     def resolve_single(
         self,
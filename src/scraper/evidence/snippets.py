@@ -1,7 +1,31 @@
 import re
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Optional, Union
 
-from bs4 import BeautifulSoup
+from lxml import etree
+
+_FOOTNOTE_RE = re.compile(r'\[\d+\]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# MediaWiki output has a fixed structure, so the extractors query it with XPath
+# expressions compiled once instead of walking a BeautifulSoup tree.
+# lxml parsers serialize their use, so each thread gets its own
+_PARSERS = threading.local()
+_XP_PARSER_OUTPUT = etree.XPath(
+    "(//div[contains(concat(' ', normalize-space(@class), ' '), ' mw-parser-output ')])[1]"
+)
+_XP_PARAGRAPHS = etree.XPath(".//p")
+# Same selection as find_table_index() in the member-list parser: class contains "wikitable"
+_XP_WIKITABLES = etree.XPath("//table[contains(@class, 'wikitable')]")
+_XP_TABLES = etree.XPath("//table")
+_XP_ROWS = etree.XPath(".//tr")
+_XP_CELLS = etree.XPath(".//td | .//th")
+# Text nodes as BeautifulSoup's get_text() collects them: without the CSS of inline
+# TemplateStyles (<style>) or <script> contents
+_XP_TEXT = etree.XPath("descendant::text()[not(ancestor::style or ancestor::script)]")
+
+# Window after the start of mw-parser-output in which the lead paragraph is looked for first
+LEAD_SLICE_CHARS = 32 * 1024
 
 
 def clean_snippet_text(text: str) -> str:
@@ -15,10 +39,10 @@ def clean_snippet_text(text: str) -> str:
         return ""
     
     # Remove footnote markers [1], [2], etc.
-    text = re.sub(r'\[\d+\]', '', text)
+    text = _FOOTNOTE_RE.sub('', text)
     
     # Collapse whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Strip
     text = text.strip()
@@ -26,45 +50,94 @@ def clean_snippet_text(text: str) -> str:
     return text
 
 
-def extract_lead_paragraph(html: str, max_len: int = 500) -> Optional[str]:
+def _truncate(text: str, max_len: int) -> str:
+    """Cut text at a word boundary to at most max_len chars, marking the cut with "..."."""
+    if len(text) > max_len:
+        # rfind scans in place instead of splitting a max_len copy into a list
+        i = text.rfind(' ', 0, max_len)
+        return (text[:i] if i > 0 else text[:max_len]) + "..."
+    return text
+
+
+# Extractors accept raw HTML or a tree from parse_html(), so callers can parse a page once
+HtmlInput = Union[str, etree._Element]
+
+
+def parse_html(html: str) -> Optional[etree._Element]:
+    """Parse MediaWiki HTML into an lxml tree (None for empty input)."""
+    if not html:
+        return None
+    parser = getattr(_PARSERS, "html", None)
+    if parser is None:
+        parser = _PARSERS.html = etree.HTMLParser()
+    return etree.fromstring(html, parser)
+
+
+def _as_tree(html: Optional[HtmlInput]) -> Optional[etree._Element]:
+    return parse_html(html) if isinstance(html, str) else html
+
+
+def _text(element: etree._Element) -> str:
+    return "".join(_XP_TEXT(element))
+
+
+def _lead_slice(html: str) -> Optional[str]:
+    """
+    Cut the start of mw-parser-output out of a large page, ending after a closed </p>.
+
+    Returns None if the page is small enough to parse whole or has no such window.
+    """
+    start = html.find("mw-parser-output")
+    if start < 0 or len(html) - start <= LEAD_SLICE_CHARS:
+        return None
+    tag_start = html.rfind("<", 0, start)
+    end = html.rfind("</p>", start, start + LEAD_SLICE_CHARS)
+    if tag_start < 0 or end < 0:
+        return None
+    return html[tag_start:end + len("</p>")]
+
+
+def extract_lead_paragraph(html: Optional[HtmlInput], max_len: int = 500) -> Optional[str]:
     """
     Extract first clean paragraph from MediaWiki parsed HTML.
     
     Looks for <p> tags in mw-parser-output, picks first with len >= 80 chars.
+    For large raw HTML only the start of mw-parser-output is parsed, unless it holds no such paragraph.
     """
-    if not html:
-        return None
+    if isinstance(html, str):
+        html_slice = _lead_slice(html)
+        if html_slice is not None:
+            paragraph = _find_lead_paragraph(parse_html(html_slice), max_len, require_long=True)
+            if paragraph:
+                return paragraph
     
-    soup = BeautifulSoup(html, "html.parser")
-    parser_output = soup.find("div", class_="mw-parser-output")
+    return _find_lead_paragraph(_as_tree(html), max_len)
+
+
+def _find_lead_paragraph(
+    tree: Optional[etree._Element], max_len: int, require_long: bool = False
+) -> Optional[str]:
+    parser_output = _XP_PARSER_OUTPUT(tree) if tree is not None else None
     
     if not parser_output:
         return None
     
-    # Find first <p> with sufficient content
-    for p in parser_output.find_all("p"):
-        text = p.get_text()
-        cleaned = clean_snippet_text(text)
+    # First <p> with sufficient content, else the first <p> with any content
+    fallback = None
+    for p in _XP_PARAGRAPHS(parser_output[0]):
+        cleaned = clean_snippet_text(_text(p))
         
         if len(cleaned) >= 80:
-            if len(cleaned) > max_len:
-                cleaned = cleaned[:max_len].rsplit(' ', 1)[0] + "..."
-            return cleaned
-    
-    # Fallback: any <p> with content
-    for p in parser_output.find_all("p"):
-        text = p.get_text()
-        cleaned = clean_snippet_text(text)
-        
-        if cleaned:
-            if len(cleaned) > max_len:
-                cleaned = cleaned[:max_len].rsplit(' ', 1)[0] + "..."
-            return cleaned
+            return _truncate(cleaned, max_len)
+        if cleaned and fallback is None:
+            fallback = cleaned
     
-    return None
+    if require_long:
+        return None
+    return _truncate(fallback, max_len) if fallback else None
 
 
-def extract_table_row_snippet(html: str, snippet_ref: Dict[str, Any], max_len: int = 500) -> Optional[str]:
+def extract_table_row_snippet(html: Optional[HtmlInput], snippet_ref: Dict[str, Any], max_len: int = 500) -> Optional[str]:
     """
     Extract snippet from specific table row based on snippet_ref dict.
     
@@ -78,7 +151,7 @@ def extract_table_row_snippet(html: str, snippet_ref: Dict[str, Any], max_len: i
         ...
     }
     """
-    if not html or not snippet_ref:
+    if not snippet_ref:
         return None
     
     if snippet_ref.get("type") != "table_row":
@@ -87,18 +160,20 @@ def extract_table_row_snippet(html: str, snippet_ref: Dict[str, Any], max_len: i
     table_index = snippet_ref.get("table_index", 0)
     row_index = snippet_ref.get("row_index", 0)
     
-    soup = BeautifulSoup(html, "html.parser")
+    tree = _as_tree(html)
+    if tree is None:
+        return None
     
     # Find all wikitable tables (or all tables if none)
-    all_tables = soup.find_all("table", class_=lambda x: x and "wikitable" in x)
+    all_tables = _XP_WIKITABLES(tree)
     if not all_tables:
-        all_tables = soup.find_all("table")
+        all_tables = _XP_TABLES(tree)
     
     if table_index >= len(all_tables):
         return None
     
     table = all_tables[table_index]
-    rows = table.find_all("tr")
+    rows = _XP_ROWS(table)
     
     # Skip header row, row_index is 0-based for data rows
     data_rows = rows[1:] if len(rows) > 1 else rows
@@ -107,12 +182,12 @@ def extract_table_row_snippet(html: str, snippet_ref: Dict[str, Any], max_len: i
         return None
     
     row = data_rows[row_index]
-    cells = row.find_all(["td", "th"])
+    cells = _XP_CELLS(row)
     
     # Extract text from cells and join with " | "
     cell_texts = []
     for cell in cells:
-        text = cell.get_text().strip()
+        text = _text(cell).strip()
         if text:
             cell_texts.append(text)
     
@@ -123,17 +198,31 @@ def extract_table_row_snippet(html: str, snippet_ref: Dict[str, Any], max_len: i
     snippet = " | ".join(cell_texts)
     cleaned = clean_snippet_text(snippet)
     
-    if cleaned:
-        if len(cleaned) > max_len:
-            cleaned = cleaned[:max_len].rsplit(' ', 1)[0] + "..."
-        return cleaned
-    
-    return None
+    return _truncate(cleaned, max_len) if cleaned else None
+
+
+def normalize_snippet_ref(snippet_ref: Any) -> Any:
+    """
+    Convert a legacy "table_row:<table_index>:<row_index>" string into the snippet_ref dict.
+
+    Legacy strings only occur in old evidence index entries; anything else is returned as is.
+    """
+    if isinstance(snippet_ref, str) and snippet_ref.startswith("table_row:"):
+        parts = snippet_ref.split(":")
+        try:
+            return {
+                "type": "table_row",
+                "table_index": int(parts[1]) if len(parts) > 1 else 0,
+                "row_index": int(parts[2]) if len(parts) > 2 else 0,
+            }
+        except ValueError:
+            pass
+    return snippet_ref
 
 
 def extract_snippet(
-    html: Optional[str],
-    snippet_ref: Optional[Any] = None,
+    html: Optional[HtmlInput],
+    snippet_ref: Optional[Dict[str, Any]] = None,
     max_len: int = 500,
     prefer: str = "table_row"
 ) -> tuple[Optional[str], Optional[str]]:
@@ -141,36 +230,23 @@ def extract_snippet(
     Extract snippet from HTML.
     
     Args:
-        html: HTML content
-        snippet_ref: Dict with snippet_ref structure or legacy string format
+        html: HTML content, or a tree from parse_html()
+        snippet_ref: Dict with snippet_ref structure (see normalize_snippet_ref() for legacy strings)
         max_len: Maximum snippet length
         prefer: Preferred snippet type ("table_row" or "lead_paragraph")
     
     Returns: (snippet, snippet_source)
     """
-    if not html:
+    if html is None or html == "":
         return None, None
     
-    # Handle snippet_ref (can be Dict or legacy string)
     if snippet_ref:
         if isinstance(snippet_ref, dict) and snippet_ref.get("type") == "table_row":
+            # Parse once for both the table row and the lead paragraph fallback
+            html = _as_tree(html)
             snippet = extract_table_row_snippet(html, snippet_ref, max_len)
             if snippet:
                 return snippet, "table_row"
-        elif isinstance(snippet_ref, str) and snippet_ref.startswith("table_row:"):
-            # Legacy format support
-            try:
-                parts = snippet_ref.split(":")
-                ref_dict = {
-                    "type": "table_row",
-                    "table_index": int(parts[1]) if len(parts) > 1 else 0,
-                    "row_index": int(parts[2]) if len(parts) > 2 else 0,
-                }
-                snippet = extract_table_row_snippet(html, ref_dict, max_len)
-                if snippet:
-                    return snippet, "table_row"
-            except (ValueError, IndexError):
-                pass
     
     # Fallback: lead paragraph (if prefer is lead_paragraph or table_row not available)
     if prefer == "lead_paragraph" or (prefer == "table_row" and not snippet_ref):
@@ -179,4 +255,3 @@ def extract_snippet(
             return snippet, "lead_paragraph"
     
     return None, None
-
@@ -1,14 +1,19 @@
-import json
 import logging
 import sys
 from datetime import datetime, timezone
 from typing import Any, Dict
 
+import orjson
+
+# Optional context attributes passed via `extra=` that are copied into the log line
+_CONTEXT_FIELDS = ("run_id", "seed_key", "page_title")
+
 
 class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # orjson serializes the datetime itself, in isoformat() layout
+            "timestamp": datetime.now(timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -17,22 +22,21 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        if hasattr(record, "run_id"):
-            log_data["run_id"] = record.run_id
-
-        if hasattr(record, "seed_key"):
-            log_data["seed_key"] = record.seed_key
-
-        if hasattr(record, "page_title"):
-            log_data["page_title"] = record.page_title
+        record_dict = record.__dict__
+        for field in _CONTEXT_FIELDS:
+            if field in record_dict:
+                log_data[field] = record_dict[field]
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return orjson.dumps(log_data, default=str).decode()
 
 
 def setup_logging(level: str = "INFO") -> None:
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JSONFormatter())
+    """Install the JSON stdout handler on the root logger (idempotent)."""
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
+    if any(isinstance(h.formatter, JSONFormatter) for h in root_logger.handlers):
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JSONFormatter())
     root_logger.addHandler(handler)
 
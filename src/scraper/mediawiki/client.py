@@ -1,62 +1,162 @@
 import asyncio
-import time
-from typing import Any, Dict, Optional
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
 
 from scraper.config import get_settings
+from scraper.utils.ratelimit import TokenBucket, api_retry
 
 settings = get_settings()
 
+# utf8=1 sends non-ASCII characters as UTF-8 instead of \uXXXX escapes; German pages
+# are full of umlauts, so bodies get smaller while decoding to the same JSON values
+_JSON_FORMAT: Dict[str, Any] = {"format": "json", "utf8": 1}
+
 
 class MediaWikiClient:
     BASE_URL = "https://de.wikipedia.org/w/api.php"
 
-    def __init__(self, rate_limit_rps: float = 2.0, user_agent: Optional[str] = None):
+    def __init__(
+        self,
+        rate_limit_rps: float = 2.0,
+        user_agent: Optional[str] = None,
+        rate_limit_burst: float = 1.0,
+    ):
         self.rate_limit_rps = rate_limit_rps
         self.user_agent = user_agent or settings.mediawiki_user_agent
-        self._last_request_time = 0.0
-        self._lock = asyncio.Lock()
+        self._bucket = TokenBucket(rate_limit_rps, capacity=rate_limit_burst)
+        # Loop-bound state per thread, (re)created by _bind_loop() on first use in an event loop
+        self._local = threading.local()
+
+    def _bind_loop(self) -> None:
+        """
+        Create the pooled HTTP client for the running event loop.
+
+        It is tied to the loop it was created in, so a client reused across several
+        asyncio.run() calls (or from several threads) gets a fresh one for each loop.
+        """
+        loop = asyncio.get_running_loop()
+        local = self._local
+        if getattr(local, "loop", None) is not loop:
+            # A client left from an earlier loop is replaced, not closed: its connections
+            # belong to that (usually finished) loop. Owners close the client with
+            # `async with` / aclose() before their loop ends, so normally there is none.
+            local.loop = loop
+            local.http = httpx.AsyncClient(
+                timeout=30.0,
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(
+                    max_connections=16, max_keepalive_connections=16, keepalive_expiry=30.0
+                ),
+            )
+
+    async def aclose(self) -> None:
+        """Close pooled connections of the current event loop."""
+        local = self._local
+        http = getattr(local, "http", None)
+        if http is not None and local.loop is asyncio.get_running_loop():
+            await http.aclose()
+        local.http = None
+        local.loop = None
+
+    async def __aenter__(self) -> "MediaWikiClient":
+        self._bind_loop()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        return self._local.http
 
     async def _rate_limit(self) -> None:
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self._last_request_time
-            min_interval = 1.0 / self.rate_limit_rps
-            if elapsed < min_interval:
-                await asyncio.sleep(min_interval - elapsed)
-            self._last_request_time = time.time()
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
-    async def fetch_parse(
-        self, page_title: str, include_sections: bool = False
-    ) -> Dict[str, Any]:
+        self._bind_loop()
+        # The bucket is thread-safe, so the rate limit holds across concurrent event
+        # loops (e.g. seeds run in threads)
+        await self._bucket.acquire()
+
+    @api_retry
+    async def _get_parse(
+        self, page_title: str, include_sections: bool, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
         await self._rate_limit()
 
         params: Dict[str, Any] = {
             "action": "parse",
             "page": page_title,
             "prop": "text|revid|displaytitle",
-            "format": "json",
+            **_JSON_FORMAT,
         }
         if include_sections:
             params["prop"] += "|sections"
 
-        headers = {"User-Agent": self.user_agent}
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(self.BASE_URL, params=params, headers=headers)
+        response = await self._http.get(self.BASE_URL, params=params, headers=headers)
+        if response.status_code != 304:
             response.raise_for_status()
-            return response.json()
+        return response
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+    async def fetch_parse(
+        self, page_title: str, include_sections: bool = False
+    ) -> Dict[str, Any]:
+        response = await self._get_parse(page_title, include_sections)
+        return orjson.loads(response.content)
+
+    async def fetch_parse_conditional(
+        self,
+        page_title: str,
+        include_sections: bool = False,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Optional[str]]]:
+        """
+        Fetch a page with action=parse as a conditional GET against a cached response.
+
+        Returns (response JSON, validators); the JSON is None if the server answered
+        304 Not Modified. validators holds the ETag and Last-Modified of the response.
+        """
+        headers: Dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = await self._get_parse(page_title, include_sections, headers)
+        validators = {
+            "etag": response.headers.get("ETag", etag),
+            "last_modified": response.headers.get("Last-Modified", last_modified),
+        }
+        if response.status_code == 304:
+            return None, validators
+        return orjson.loads(response.content), validators
+
+    async def fetch_parse_many(
+        self,
+        page_titles: List[str],
+        include_sections: bool = False,
+        concurrency: Optional[int] = None,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Fetch several pages with action=parse concurrently.
+
+        At most `concurrency` requests are in flight (default: twice the rate limit), so
+        their round trips overlap while the rate limiter still bounds requests per second.
+        Returns one result per title, in order; failures are returned as exception objects.
+        """
+        if concurrency is None:
+            concurrency = max(1, int(self.rate_limit_rps * 2))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(page_title: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.fetch_parse(page_title, include_sections=include_sections)
+
+        return await asyncio.gather(*[_one(t) for t in page_titles], return_exceptions=True)
+
+    @api_retry
     async def fetch_query(
         self, page_title: str
     ) -> Dict[str, Any]:
@@ -67,20 +167,33 @@ class MediaWikiClient:
             "prop": "info|revisions",
             "titles": page_title,
             "rvprop": "ids|timestamp",
-            "format": "json",
+            **_JSON_FORMAT,
         }
 
-        headers = {"User-Agent": self.user_agent}
+        response = await self._http.get(self.BASE_URL, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(self.BASE_URL, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+    @api_retry
+    async def fetch_query_batch(
+        self, page_titles: List[str]
+    ) -> Dict[str, Any]:
+        """Query info and current revision for up to 50 titles in one request."""
+        await self._rate_limit()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+        params: Dict[str, Any] = {
+            "action": "query",
+            "prop": "info|revisions",
+            "titles": "|".join(page_titles),
+            "rvprop": "ids|timestamp",
+            **_JSON_FORMAT,
+        }
+
+        response = await self._http.get(self.BASE_URL, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    @api_retry
     async def fetch_search(
         self, search_query: str, limit: int = 50, continue_token: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -92,22 +205,22 @@ class MediaWikiClient:
             "srsearch": search_query,
             "srlimit": limit,
             "srnamespace": 0,  # Main namespace only
-            "format": "json",
+            **_JSON_FORMAT,
         }
         if continue_token:
             params["srcontinue"] = continue_token
 
-        headers = {"User-Agent": self.user_agent}
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(self.BASE_URL, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._http.get(self.BASE_URL, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
 
+@lru_cache(maxsize=1)
 def get_client() -> MediaWikiClient:
+    """Return the process-wide client, so rate limiting and connection pooling are shared."""
     return MediaWikiClient(
         rate_limit_rps=settings.scraper_rate_limit_rps,
+        rate_limit_burst=settings.scraper_rate_limit_burst,
         user_agent=settings.mediawiki_user_agent,
     )
 
@@ -30,6 +30,8 @@ class CachedResponseMetadata(BaseModel):
     page_id: int = Field(..., description="Page ID")
     revision_id: int = Field(..., description="Revision ID")
     endpoint_kind: str = Field(..., description="parse or query")
+    etag: Optional[str] = Field(None, description="ETag of the response, for conditional requests")
+    last_modified: Optional[str] = Field(None, description="Last-Modified of the response, for conditional requests")
 
 
 class LatestCacheManifest(BaseModel):
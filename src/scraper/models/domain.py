@@ -1,7 +1,6 @@
-from datetime import date
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Provenance(BaseModel):
@@ -14,6 +13,8 @@ class Provenance(BaseModel):
 
 
 class Event(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     event_type: str = Field(..., description="Type of event")
     description: str = Field(..., description="Event description")
     evidence_ids: List[str] = Field(default_factory=list, description="Evidence IDs supporting this event")
@@ -22,6 +23,9 @@ class Event(BaseModel):
 
 class EvidenceRef(BaseModel):
     """Entity-level reference to Evidence with optional row-level snippet reference."""
+    # Immutable value object, so one instance can be shared between entities
+    model_config = ConfigDict(frozen=True)
+
     evidence_id: str = Field(..., description="Evidence ID (page-level)")
     snippet_ref: Optional[Dict[str, Any]] = Field(None, description="Row-level snippet reference (e.g. table_row with table_index, row_index)")
     purpose: Optional[str] = Field(None, description="Purpose of this evidence reference: membership_row, person_page_intro, etc.")
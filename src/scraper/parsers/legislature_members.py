@@ -1,45 +1,82 @@
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 from dateutil.parser import parse as parse_date
 
 from scraper.mediawiki.types import MediaWikiParseResponse
-from scraper.models.domain import Event, LegislatureMember, Mandate, Person
-from scraper.utils.ids import generate_evidence_id, generate_mandate_id, generate_person_id
+from scraper.models.domain import Event, EvidenceRef, LegislatureMember, Mandate, Person
+from scraper.utils.ids import (
+    generate_evidence_id,
+    generate_legislature_id,
+    generate_mandate_id,
+    generate_person_id,
+)
 from scraper.utils.hashing import sha256_hash_json
 from scraper.utils.time import utc_now_iso
 
 
+# Event types recognized in the notes column, in the order their events are emitted
+_EVENT_TYPES = (
+    "nachgerückt",
+    "ausgeschieden",
+    "fraktionsaustritt",
+    "parteiwechsel",
+    "fraktionswechsel",
+)
+
+# Members tables are usually found by their header row alone, which only needs the tables;
+# straining skips building soup objects for the prose, navboxes and references around them
+_MEMBERS_STRAINER = SoupStrainer("table")
+
+
+def _text(element: Any) -> str:
+    """element.get_text(); elements with a single text node (most cells and links) skip the tree walk."""
+    string = element.string
+    # Exact type check: comments and CDATA are NavigableString subclasses that get_text() skips
+    return string if type(string) is NavigableString else element.get_text()
+
+
+def _cells(row: Any) -> List[Any]:
+    """row.find_all(["td", "th"]); a plain descendant walk skips bs4's generic multi-name filter."""
+    return [e for e in row.descendants if type(e) is Tag and e.name in ("td", "th")]
+
+
 def normalize_header(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip().lower())
+    # split() collapses the same whitespace as re's \s+ and strips the ends
+    return " ".join(text.lower().split())
 
 
-def find_members_table(soup: BeautifulSoup, seed_hints: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+def find_members_table(
+    soup: BeautifulSoup,
+    seed_hints: Optional[Dict[str, Any]] = None,
+    tables: Optional[List[Any]] = None,
+) -> Optional[Any]:
+    """Find the members table; tables may pass soup.find_all("table") if already known."""
     keywords = ["mitglieder", "abgeordnete", "fraktionen", "fraktion", "partei", "wahlkreis", "anmerkungen"]
     if seed_hints and "section_keywords" in seed_hints:
         keywords.extend(seed_hints["section_keywords"])
 
-    all_tables = soup.find_all("table")
+    all_tables = tables if tables is not None else soup.find_all("table")
     
     for table in all_tables:
         header_row = table.find("tr")
         if not header_row:
             continue
         
-        headers = header_row.find_all(["th", "td"])
-        header_texts = [normalize_header(h.get_text()) for h in headers]
-        
-        has_name = any("name" in ht for ht in header_texts)
-        has_party_or_fraktion = any("partei" in ht or "fraktion" in ht for ht in header_texts)
-        has_wahlkreis = any("wahlkreis" in ht for ht in header_texts)
+        # Normalized headers contain no newlines, so a keyword found in the joined text
+        # lies within one header; one substring scan per keyword instead of one per header
+        header_text = "\n".join(normalize_header(_text(h)) for h in _cells(header_row))
         
-        if has_name and (has_party_or_fraktion or has_wahlkreis):
+        if "name" in header_text and (
+            "partei" in header_text or "fraktion" in header_text or "wahlkreis" in header_text
+        ):
             return table
 
     for heading in soup.find_all(["h2", "h3", "h4"]):
-        heading_text = normalize_header(heading.get_text())
+        heading_text = normalize_header(_text(heading))
         for keyword in keywords:
             if keyword in heading_text:
                 next_table = heading.find_next_sibling("table")
@@ -52,45 +89,81 @@ def find_members_table(soup: BeautifulSoup, seed_hints: Optional[Dict[str, Any]]
     return None
 
 
+# Header keyword -> column, in match priority: a header containing "name" is the name
+# column even if it also contains "partei"
+_HEADER_KEYWORDS = {
+    "name": "name",
+    "abgeordnete": "name",
+    "partei": "party",
+    "fraktion": "party",
+    "wahlkreis": "wahlkreis",
+    "anmerkung": "notes",
+    "bemerkung": "notes",
+    "notiz": "notes",
+    "von": "start",
+    "start": "start",
+    "beginn": "start",
+    "bis": "end",
+    "ende": "end",
+}
+
+
 def extract_table_headers(table: Any) -> Dict[str, int]:
     headers = {}
     header_row = table.find("tr")
     if not header_row:
         return headers
 
-    cells = header_row.find_all(["th", "td"])
+    cells = _cells(header_row)
     for idx, cell in enumerate(cells):
-        text = normalize_header(cell.get_text())
-        if "name" in text or "abgeordnete" in text:
-            headers["name"] = idx
-        elif "partei" in text or "fraktion" in text:
-            headers["party"] = idx
-        elif "wahlkreis" in text:
-            headers["wahlkreis"] = idx
-        elif "anmerkung" in text or "bemerkung" in text or "notiz" in text:
-            headers["notes"] = idx
-        elif "von" in text or "start" in text or "beginn" in text:
-            headers["start"] = idx
-        elif "bis" in text or "ende" in text:
-            headers["end"] = idx
+        text = normalize_header(_text(cell))
+        for keyword, column in _HEADER_KEYWORDS.items():
+            if keyword in text:
+                # A later matching header overrides an earlier one for the same column
+                headers[column] = idx
+                break
 
     return headers
 
 
+class ColumnIndexes(NamedTuple):
+    """Column indexes of a members table, resolved once from extract_table_headers()."""
+
+    name: Optional[int]
+    party: Optional[int]
+    wahlkreis: Optional[int]
+    notes: Optional[int]
+    start: Optional[int]
+    end: Optional[int]
+    # Rows with fewer cells than this cannot hold all recognized columns
+    min_cells: int
+
+    @classmethod
+    def from_headers(cls, headers: Dict[str, int]) -> "ColumnIndexes":
+        return cls(
+            name=headers.get("name"),
+            party=headers.get("party"),
+            wahlkreis=headers.get("wahlkreis"),
+            notes=headers.get("notes"),
+            start=headers.get("start"),
+            end=headers.get("end"),
+            min_cells=max(headers.values(), default=0) + 1,
+        )
+
+
+def _cell_text(cells: List[Any], idx: Optional[int]) -> Optional[str]:
+    if idx is None or idx >= len(cells):
+        return None
+    return _text(cells[idx]).strip()
+
+
 def parse_event_from_notes(notes_text: str, evidence_id: str) -> List[Event]:
     events = []
+    # The event types are literal keywords; substring checks beat a regex scan on short notes
     notes_lower = notes_text.lower()
 
-    event_patterns = [
-        (r"nachgerückt", "nachgerückt"),
-        (r"ausgeschieden", "ausgeschieden"),
-        (r"fraktionsaustritt", "fraktionsaustritt"),
-        (r"parteiwechsel", "parteiwechsel"),
-        (r"fraktionswechsel", "fraktionswechsel"),
-    ]
-
-    for pattern, event_type in event_patterns:
-        if re.search(pattern, notes_lower):
+    for event_type in _EVENT_TYPES:
+        if event_type in notes_lower:
             events.append(
                 Event(
                     event_type=event_type,
@@ -102,30 +175,73 @@ def parse_event_from_notes(notes_text: str, evidence_id: str) -> List[Event]:
     return events
 
 
+_MONTHS_DE = {
+    "januar": 1, "jänner": 1, "februar": 2, "märz": 3, "april": 4, "mai": 5, "juni": 6,
+    "juli": 7, "august": 8, "september": 9, "oktober": 10, "november": 11, "dezember": 12,
+}
+# "1. Januar 1990"
+_DE_DATE_RE = re.compile(
+    r"(\d{1,2})\.\s*(" + "|".join(_MONTHS_DE) + r")\s*(\d{4})", re.IGNORECASE
+)
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+# "01.01.1990"
+_NUMERIC_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+
+
+def _parse_date_de(date_str: str) -> Optional[date]:
+    """Parse the date formats used in German Wikipedia tables, None if there is none."""
+    m = _ISO_DATE_RE.fullmatch(date_str)
+    if m:
+        return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    m = _NUMERIC_DATE_RE.fullmatch(date_str)
+    if m:
+        return date(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+    m = _DE_DATE_RE.search(date_str)
+    if m:
+        return date(int(m.group(3)), _MONTHS_DE[m.group(2).lower()], int(m.group(1)))
+    return None
+
+
+@lru_cache(maxsize=4096)
 def parse_date_safe(date_str: Optional[str]) -> Optional[str]:
     if not date_str:
         return None
+    date_str = date_str.strip()
+    # German formats first; dateutil would misread "01.02.1990" as January 2nd and
+    # does not know German month names
+    try:
+        parsed = _parse_date_de(date_str)
+    except ValueError:
+        parsed = None
+    if parsed is not None:
+        return parsed.isoformat()
     try:
         dt = parse_date(date_str, fuzzy=True)
         return dt.date().isoformat()
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return None
 
 
-def extract_person_from_row(
-    row: Any,
-    headers: Dict[str, int],
+def extract_row(
+    cells: List[Any],
+    columns: ColumnIndexes,
     seed_data: Dict[str, Any],
     evidence_id: str,
     table_index: int = 0,
     row_index: int = 0,
     page_title: str = "",
-) -> Optional[tuple[Person, Any]]:
-    cells = row.find_all(["td", "th"])
-    if len(cells) <= max(headers.values(), default=0):
+    created_at: Optional[str] = None,
+) -> Optional[tuple[Person, Mandate]]:
+    """
+    Extract the person and their mandate from one table row in a single pass.
+
+    cells are the row's cells (_cells(row)). created_at is the timestamp
+    of the membership EvidenceRef, shared by all rows of a table (default: now).
+    """
+    if len(cells) < columns.min_cells:
         return None
 
-    name_cell_idx = headers.get("name")
+    name_cell_idx = columns.name
     if name_cell_idx is None:
         return None
 
@@ -136,10 +252,10 @@ def extract_person_from_row(
 
     wikipedia_title = name_link.get("title", "").replace(" ", "_")
     if not wikipedia_title:
-        name_text = name_cell.get_text().strip()
+        name_text = _text(name_cell).strip()
         wikipedia_title = name_text.replace(" ", "_")
 
-    name = name_link.get_text().strip() or name_cell.get_text().strip()
+    name = _text(name_link).strip() or _text(name_cell).strip()
     if not name:
         return None
 
@@ -160,15 +276,12 @@ def extract_person_from_row(
         }
     }
 
-    # Create EvidenceRef for membership row (will be attached to Mandate, not Person)
-    from scraper.models.domain import EvidenceRef
-    from scraper.utils.time import utc_now_iso
-    
+    # EvidenceRef for the membership row (attached to the Mandate, not the Person)
     membership_evidence_ref = EvidenceRef(
         evidence_id=evidence_id,
         snippet_ref=snippet_ref,
         purpose="membership_row",
-        created_at=utc_now_iso(),
+        created_at=created_at or utc_now_iso(),
     )
 
     person = Person(
@@ -179,50 +292,14 @@ def extract_person_from_row(
         evidence_ids=[evidence_id],  # Legacy: will be derived from evidence_refs in model_post_init
         evidence_refs=[],  # Membership row EvidenceRef goes to Mandate, not Person
     )
-    
-    return person, membership_evidence_ref
-
-
-def extract_mandate_from_row(
-    row: Any,
-    headers: Dict[str, int],
-    person: Person,
-    seed_data: Dict[str, Any],
-    evidence_id: str,
-    membership_evidence_ref: Any,
-) -> Optional[Mandate]:
-    cells = row.find_all(["td", "th"])
-
-    party_cell_idx = headers.get("party")
-    party_name = None
-    if party_cell_idx is not None and party_cell_idx < len(cells):
-        party_name = cells[party_cell_idx].get_text().strip()
 
-    wahlkreis = None
-    wahlkreis_idx = headers.get("wahlkreis")
-    if wahlkreis_idx is not None and wahlkreis_idx < len(cells):
-        wahlkreis = cells[wahlkreis_idx].get_text().strip()
-
-    notes = None
-    notes_idx = headers.get("notes")
-    if notes_idx is not None and notes_idx < len(cells):
-        notes = cells[notes_idx].get_text().strip()
+    party_name = _cell_text(cells, columns.party)
+    wahlkreis = _cell_text(cells, columns.wahlkreis)
+    notes = _cell_text(cells, columns.notes)
 
     time_range = seed_data.get("expected_time_range", {})
-    start_date = parse_date_safe(time_range.get("start"))
-    end_date = parse_date_safe(time_range.get("end"))
-
-    start_idx = headers.get("start")
-    if start_idx is not None and start_idx < len(cells):
-        parsed_start = parse_date_safe(cells[start_idx].get_text().strip())
-        if parsed_start:
-            start_date = parsed_start
-
-    end_idx = headers.get("end")
-    if end_idx is not None and end_idx < len(cells):
-        parsed_end = parse_date_safe(cells[end_idx].get_text().strip())
-        if parsed_end:
-            end_date = parsed_end
+    start_date = parse_date_safe(_cell_text(cells, columns.start)) or parse_date_safe(time_range.get("start"))
+    end_date = parse_date_safe(_cell_text(cells, columns.end)) or parse_date_safe(time_range.get("end"))
 
     if not start_date:
         start_date = time_range.get("start")
@@ -238,8 +315,6 @@ def extract_mandate_from_row(
     state = seed_data.get("hints", {}).get("state", "")
     legislature_number = seed_data.get("hints", {}).get("legislature_number")
     if parliament and state and legislature_number:
-        from scraper.utils.ids import generate_legislature_id
-
         legislature_id = generate_legislature_id(parliament, state, legislature_number)
 
     mandate_id = generate_mandate_id(
@@ -250,12 +325,7 @@ def extract_mandate_from_row(
         role="member",
     )
 
-    # Attach membership EvidenceRef to Mandate (not Person)
-    from scraper.models.domain import EvidenceRef
-    
-    mandate_evidence_refs = [membership_evidence_ref] if membership_evidence_ref else []
-    
-    return Mandate(
+    mandate = Mandate(
         id=mandate_id,
         person_id=person.id,
         legislature_id=legislature_id,
@@ -266,46 +336,67 @@ def extract_mandate_from_row(
         role="member",
         events=events,
         notes=notes,
-        evidence_refs=mandate_evidence_refs,  # Row-level reference with table_row snippet_ref
+        evidence_refs=[membership_evidence_ref],  # Row-level reference with table_row snippet_ref
         evidence_ids=[evidence_id],  # Legacy: will be derived from evidence_refs
     )
 
+    return person, mandate
+
+
+def _is_wikitable(table: Any) -> bool:
+    # Substring match on the class attribute, like contains(@class, 'wikitable') in the snippet extractor
+    return "wikitable" in " ".join(table.get("class") or ())
 
-def find_table_index(soup: BeautifulSoup, target_table: Any) -> int:
+
+def find_table_index(soup: BeautifulSoup, target_table: Any, tables: Optional[List[Any]] = None) -> int:
     """
     Find the index of target_table among all wikitable tables in the page.
-    Returns 0-based index.
+    Returns 0-based index. tables may pass soup.find_all("table") if already known.
     """
-    all_tables = soup.find_all("table", class_=lambda x: x and "wikitable" in x)
+    if tables is None:
+        tables = soup.find_all("table")
+    all_tables = [t for t in tables if _is_wikitable(t)]
     if not all_tables:
         # Fallback: all tables
-        all_tables = soup.find_all("table")
+        all_tables = tables
     
     for idx, table in enumerate(all_tables):
-        if table == target_table:
+        if table is target_table:
             return idx
     
     return 0  # Default to first table if not found
 
 
 def parse_legislature_members(
-    response: MediaWikiParseResponse, seed_key: str
+    response: MediaWikiParseResponse, seed_key: str, seed_data: Optional[Dict[str, Any]] = None
 ) -> LegislatureMember:
-    from scraper.cache.mediawiki_cache import get_seed
-
-    seed_data = get_seed(seed_key)
-    soup = BeautifulSoup(response.html, "html.parser")
-
-    table = find_members_table(soup, seed_data.get("hints"))
+    """Parse a member list; seed_data may pass get_seed(seed_key) if the caller already has it."""
+    if seed_data is None:
+        from scraper.cache.mediawiki_cache import get_seed
+
+        seed_data = get_seed(seed_key)
+    hints = seed_data.get("hints")
+    # Strained soup holds the same tables in the same order, so table_index is unaffected
+    soup = BeautifulSoup(response.html, "lxml", parse_only=_MEMBERS_STRAINER)
+
+    # One traversal for all tables, shared by table lookup and table_index
+    tables = soup.find_all("table")
+    table = find_members_table(soup, hints, tables)
+    if not table:
+        # The heading fallback needs the headings and their original siblings: full parse
+        soup = BeautifulSoup(response.html, "lxml")
+        tables = soup.find_all("table")
+        table = find_members_table(soup, hints, tables)
     if not table:
         raise ValueError("Could not find members table")
 
     headers = extract_table_headers(table)
     if not headers:
         raise ValueError("Could not extract table headers")
+    columns = ColumnIndexes.from_headers(headers)
 
     # Determine table_index (which table in the page)
-    table_index = find_table_index(soup, table)
+    table_index = find_table_index(soup, table, tables)
 
     # Use sha256 from metadata if available, otherwise compute from parse
     # This ensures consistency with the evidence index
@@ -323,18 +414,16 @@ def parse_legislature_members(
     members = []
     all_rows = table.find_all("tr")
     data_rows = all_rows[1:]  # Skip header row
+    # All rows of the table are extracted at the same time
+    created_at = utc_now_iso()
     
     for row_index, row in enumerate(data_rows):
-        # Extract person and membership EvidenceRef
-        result = extract_person_from_row(row, headers, seed_data, evidence_id, table_index, row_index, response.page_title)
-        if not result:
-            continue
-        
-        person, membership_evidence_ref = result
-
-        mandate = extract_mandate_from_row(row, headers, person, seed_data, evidence_id, membership_evidence_ref)
-        if mandate:
-            members.append((person, mandate))
+        result = extract_row(
+            _cells(row), columns, seed_data, evidence_id,
+            table_index, row_index, response.page_title, created_at,
+        )
+        if result:
+            members.append(result)
 
     return LegislatureMember(
         seed_key=seed_key,
@@ -1,4 +1,5 @@
 import re
+from datetime import date
 from typing import Any, Dict, List, Optional
 
 from bs4 import BeautifulSoup
@@ -9,6 +10,20 @@ from scraper.models.domain import Person
 from scraper.utils.ids import generate_evidence_id, generate_person_id
 from scraper.utils.hashing import sha256_hash_json
 
+_INFOBOX_CLASS_RE = re.compile(r"infobox|biografie")
+
+
+def _parse_date(date_str: str, fuzzy: bool) -> str:
+    """
+    Parse date_str into an ISO date string with dateutil (fuzzy if asked).
+
+    Plain YYYY-MM-DD (bday spans, time datetimes) takes the date.fromisoformat fast path.
+    """
+    try:
+        return date.fromisoformat(date_str).isoformat()
+    except ValueError:
+        return parse_date(date_str, fuzzy=fuzzy).date().isoformat()
+
 
 def extract_intro(soup: BeautifulSoup) -> str:
     content = soup.find("div", class_="mw-parser-output")
@@ -29,7 +44,7 @@ def extract_intro(soup: BeautifulSoup) -> str:
 
 
 def extract_infobox_keyfacts(soup: BeautifulSoup) -> Dict[str, Any]:
-    infobox = soup.find("table", class_=re.compile(r"infobox|biografie"))
+    infobox = soup.find("table", class_=_INFOBOX_CLASS_RE)
     if not infobox:
         return {}
 
@@ -53,8 +68,7 @@ def extract_infobox_keyfacts(soup: BeautifulSoup) -> Dict[str, Any]:
             if bday_span:
                 date_str = bday_span.get_text().strip()
                 try:
-                    dt = parse_date(date_str, fuzzy=False)
-                    keyfacts["birth_date"] = dt.date().isoformat()
+                    keyfacts["birth_date"] = _parse_date(date_str, fuzzy=False)
                     keyfacts["birth_date_status"] = "extracted"
                     birth_date_extracted = True
                 except (ValueError, TypeError):
@@ -66,8 +80,7 @@ def extract_infobox_keyfacts(soup: BeautifulSoup) -> Dict[str, Any]:
                 if time_tag and time_tag.get("datetime"):
                     date_str = time_tag.get("datetime")
                     try:
-                        dt = parse_date(date_str, fuzzy=False)
-                        keyfacts["birth_date"] = dt.date().isoformat()
+                        keyfacts["birth_date"] = _parse_date(date_str, fuzzy=False)
                         keyfacts["birth_date_status"] = "extracted"
                         birth_date_extracted = True
                     except (ValueError, TypeError):
@@ -83,8 +96,7 @@ def extract_infobox_keyfacts(soup: BeautifulSoup) -> Dict[str, Any]:
             else:
                 date_str = value
             try:
-                dt = parse_date(date_str, fuzzy=True)
-                keyfacts["death_date"] = dt.date().isoformat()
+                keyfacts["death_date"] = _parse_date(date_str, fuzzy=True)
             except (ValueError, TypeError):
                 pass
 
@@ -92,7 +104,7 @@ def extract_infobox_keyfacts(soup: BeautifulSoup) -> Dict[str, Any]:
 
 
 def parse_person_page(response: MediaWikiParseResponse) -> Person:
-    soup = BeautifulSoup(response.html, "html.parser")
+    soup = BeautifulSoup(response.html, "lxml")
 
     title = response.page_title.replace("_", " ")
     intro = extract_intro(soup)
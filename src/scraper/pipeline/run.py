@@ -1,19 +1,36 @@
-import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 from uuid import uuid4
 
+import orjson
+
 from scraper.cache.mediawiki_cache import get_cached_parse_response, get_seed, load_seeds
 from scraper.config import Settings
-from scraper.models.domain import Evidence, Legislature, Party
+from scraper.mediawiki.types import MediaWikiParseResponse
+from scraper.models.domain import Evidence, Legislature, LegislatureMember, Party
 from scraper.parsers.legislature_members import parse_legislature_members
 from scraper.sinks.json_export import export_json
 from scraper.sinks.meili import MeiliSink
 from scraper.sinks.neo4j import Neo4jSink
 from scraper.utils.time import utc_now_iso
 from typing import Optional, List, Any
-from uuid import uuid5
-from scraper.utils.ids import NAMESPACE_PERSON
+
+
+def _parse_worker(
+    response: MediaWikiParseResponse, seed_key: str, seed_data: Dict[str, Any]
+) -> LegislatureMember:
+    """Parse a member list in a worker process (module-level, so it can be pickled)."""
+    return parse_legislature_members(response, seed_key=seed_key, seed_data=seed_data)
+
+
+def _make_parse_pool(processes: int) -> ProcessPoolExecutor:
+    """Worker processes for _parse_worker(); tasks carry their seed data, so no setup is needed."""
+    # spawn: forking a process that already runs seed threads is unsafe
+    return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
 
 
 class PipelineRunner:
@@ -21,6 +38,18 @@ class PipelineRunner:
         self.settings = settings
         self.neo4j_sink: Neo4jSink | None = None
         self.meili_sink: MeiliSink | None = None
+        # Serializes sink init and upserts when seeds run concurrently
+        self._sink_lock = threading.Lock()
+        # Worker processes for member-list parsing while run_all() is active
+        self._parse_pool: Optional[Executor] = None
+
+    def _parse_members(
+        self, response: MediaWikiParseResponse, seed_key: str, seed_data: Dict[str, Any]
+    ) -> LegislatureMember:
+        # Parsing is CPU-bound and holds the GIL, so concurrent seeds parse in processes
+        if self._parse_pool is not None:
+            return self._parse_pool.submit(_parse_worker, response, seed_key, seed_data).result()
+        return parse_legislature_members(response, seed_key=seed_key, seed_data=seed_data)
 
     def run_single(
         self,
@@ -59,16 +88,17 @@ class PipelineRunner:
                 manifest["errors"].append(f"No cached response for {seed_key}")
                 return False
 
-            legislature_data = parse_legislature_members(response, seed_key=seed_key)
-
+            # Looked up once and shared by the parser and normalization
             seed_data = get_seed(seed_key)
+            legislature_data = self._parse_members(response, seed_key, seed_data)
+
             normalized = self._normalize(legislature_data, seed_data, response, run_id=run_id, fetch_person_pages=fetch_person_pages, force=force)
             
             if not normalized:
                 manifest["errors"].append("Normalization returned None")
                 return False
 
-            export_dir = self.settings.scraper_export_dir / run_id
+            export_dir = self.settings.export_dir / run_id
             export_dir.mkdir(parents=True, exist_ok=True)
             normalized["exported_at"] = utc_now_iso()
             export_json(normalized, export_dir, run_id=run_id)
@@ -76,10 +106,7 @@ class PipelineRunner:
 
             dip_records: List[Any] = []
             if ingest_dip or reconcile:
-                from scraper.sources.dip.ingest import ingest_person_list_sync
-                from scraper.models.domain import DipPersonRecord
-                from scraper.utils.ids import generate_evidence_id
-                from scraper.utils.hashing import sha256_hash_json
+                from scraper.sources.dip.ingest import build_dip_person_records, ingest_person_list_sync
 
                 if not self.settings.dip_api_key:
                     manifest["errors"].append(
@@ -118,28 +145,7 @@ class PipelineRunner:
                                     return False
                             # For other errors (like non-existent WP), just continue silently
                     
-                    dip_persons = all_dip_persons
-
-                for dip_person in dip_persons:
-                    evidence_id = generate_evidence_id(
-                        0,
-                        0,
-                        "dip_person",
-                        sha256_hash_json(dip_person.model_dump()),
-                    )
-                    dip_record = DipPersonRecord(
-                        id=str(uuid5(NAMESPACE_PERSON, f"dip:{dip_person.id}")),
-                        dip_person_id=dip_person.id,
-                        vorname=dip_person.vorname,
-                        nachname=dip_person.nachname,
-                        namenszusatz=dip_person.namenszusatz,
-                        titel=dip_person.titel,
-                        fraktion=dip_person.fraktion,
-                        wahlperiode=dip_person.wahlperiode,
-                        person_roles=dip_person.person_roles,
-                        evidence_ids=[evidence_id],
-                    )
-                    dip_records.append(dip_record)
+                    dip_records = build_dip_person_records(all_dip_persons)
 
             if reconcile:
                 from scraper.models.domain import WikipediaPersonRecord
@@ -212,19 +218,20 @@ class PipelineRunner:
                 normalized["link_assertions"] = assertions
                 normalized["dip_person_records"] = dip_records
 
-            if write_neo4j:
-                if not self.neo4j_sink:
-                    self.neo4j_sink = Neo4jSink(self.settings)
-                    self.neo4j_sink.init()
-                self.neo4j_sink.upsert(normalized)
-                manifest["outputs"]["neo4j"] = "upserted"
-
-            if write_meili:
-                if not self.meili_sink:
-                    self.meili_sink = MeiliSink(self.settings)
-                    self.meili_sink.init()
-                self.meili_sink.upsert(normalized)
-                manifest["outputs"]["meilisearch"] = "upserted"
+            with self._sink_lock:
+                if write_neo4j:
+                    if not self.neo4j_sink:
+                        self.neo4j_sink = Neo4jSink(self.settings)
+                        self.neo4j_sink.init()
+                    self.neo4j_sink.upsert(normalized)
+                    manifest["outputs"]["neo4j"] = "upserted"
+
+                if write_meili:
+                    if not self.meili_sink:
+                        self.meili_sink = MeiliSink(self.settings)
+                        self.meili_sink.init()
+                    self.meili_sink.upsert(normalized)
+                    manifest["outputs"]["meilisearch"] = "upserted"
 
             manifest["completed_at"] = utc_now_iso()
             manifest["status"] = "success"
@@ -242,9 +249,11 @@ class PipelineRunner:
             print(f"Traceback:\n{traceback_str}", file=sys.stderr)
             return False
         finally:
-            manifest_path = self.settings.scraper_cache_dir / "manifests" / f"{run_id}.json"
+            manifest_path = self.settings.cache_dir / "manifests" / f"{run_id}.json"
             manifest_path.parent.mkdir(parents=True, exist_ok=True)
-            manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+            manifest_path.write_bytes(
+                orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
 
         return True
 
@@ -258,11 +267,27 @@ class PipelineRunner:
         reconcile: bool = False,
         dip_wahlperiode: Optional[List[int]] = None,
         fetch_person_pages: bool = True,
+        concurrency: Optional[int] = None,
+        parse_processes: Optional[int] = None,
     ) -> bool:
+        """
+        Run the pipeline for every seed, up to `concurrency` seeds at a time.
+
+        Each seed runs in a worker thread with its own event loops; the shared clients
+        keep the global rate limit, so concurrency only overlaps parsing, cache I/O and
+        sink writes with the network waits of other seeds. Defaults to 2x the rate limit.
+
+        Member lists are parsed in up to `parse_processes` worker processes (default:
+        CPU count, at most `concurrency`); 1 parses in the seed threads instead.
+        """
         seeds = load_seeds()
-        all_success = True
-        for seed_key in seeds.keys():
-            success = self.run_single(
+        if concurrency is None:
+            concurrency = max(1, int(self.settings.scraper_rate_limit_rps * 2))
+        if parse_processes is None:
+            parse_processes = min(os.cpu_count() or 1, concurrency, len(seeds))
+
+        def run_seed(seed_key: str) -> bool:
+            return self.run_single(
                 seed_key=seed_key,
                 write_neo4j=write_neo4j,
                 write_meili=write_meili,
@@ -273,9 +298,17 @@ class PipelineRunner:
                 dip_wahlperiode=dip_wahlperiode,
                 fetch_person_pages=fetch_person_pages,
             )
-            if not success:
-                all_success = False
-        return all_success
+
+        if parse_processes > 1:
+            self._parse_pool = _make_parse_pool(parse_processes)
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                results = list(pool.map(run_seed, seeds.keys()))
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+        return all(results)
 
     def _normalize(
         self, legislature_data: Any, seed_data: Dict[str, Any], response: Any, run_id: str, fetch_person_pages: bool = True, force: bool = False
@@ -310,25 +343,22 @@ class PipelineRunner:
         # Update evidence index (page-level, no snippet_ref)
         from scraper.cache.evidence_index import update_evidence_index
         from scraper.cache.mediawiki_cache import get_cache_path
+        from scraper.utils.fs import find_raw_path
         
         member_list_evidence_id = legislature_data.evidence_id
         cache_path = get_cache_path(response.page_title, response.revision_id, "parse")
         metadata_path = cache_path / "metadata.json"
-        raw_path = cache_path / "raw.json"
+        raw_path = find_raw_path(cache_path)
         
         # Load metadata for sha256
         metadata_sha256 = None
-        if metadata_path.exists():
-            try:
-                import json as json_module
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    metadata = json_module.load(f)
-                    metadata_sha256 = metadata.get("sha256")
-            except (IOError, json_module.JSONDecodeError):
-                pass
+        try:
+            metadata_sha256 = orjson.loads(metadata_path.read_bytes()).get("sha256")
+        except (IOError, orjson.JSONDecodeError):
+            pass
         
         # Update evidence index once (page-level, no snippet_ref)
-        if metadata_path.exists() and raw_path.exists():
+        if metadata_path.exists() and raw_path is not None:
             update_evidence_index(
                 evidence_id=member_list_evidence_id,
                 source_kind="mediawiki",
@@ -342,36 +372,41 @@ class PipelineRunner:
 
         person_enrichment_stats = {"total": 0, "cached": 0, "fetched": 0, "failed": 0, "enriched": 0}
         
+        # Fetch all person pages up front in one concurrent batch
+        # (uses cache if available, unless force=True)
+        person_responses: Dict[str, Any] = {}
+        cached_titles = set()
+        if fetch_person_pages:
+            from scraper.cache.mediawiki_cache import fetch_pages_batch, get_latest_manifest_path
+
+            person_titles = list(dict.fromkeys(
+                person.wikipedia_title for person, _ in legislature_data.members if person.wikipedia_title
+            ))
+            if not force:
+                cached_titles = {t for t in person_titles if get_latest_manifest_path(t).exists()}
+            person_responses = dict(zip(
+                person_titles,
+                fetch_pages_batch(person_titles, run_id=run_id, force=force, revalidate=False),
+                strict=True,
+            ))
+        
         for person, mandate in legislature_data.members:
-            # Fetch individual person page to get intro, birth_date, etc.
-            if fetch_person_pages and person.wikipedia_title:
+            # A person listed in several rows is enriched once; later rows only add their refs
+            known_person = persons.get(person.id)
+            if known_person is not None:
+                person = known_person
+            elif fetch_person_pages and person.wikipedia_title:
+                # Enrich person with individual person page (intro, birth_date, etc.)
                 person_enrichment_stats["total"] += 1
                 try:
-                    from scraper.cache.mediawiki_cache import (
-                        fetch_and_cache_parse,
-                        get_latest_manifest_path,
-                    )
                     from scraper.parsers.person_page import parse_person_page
-                    import asyncio
-                    import logging
-                    import json
                     
                     import sys
                     
-                    # Check if cached
-                    latest_path = get_latest_manifest_path(person.wikipedia_title)
-                    was_cached = latest_path.exists() and not force
-                    
-                    # Fetch person page (uses cache if available, unless force=True)
-                    # fetch_and_cache_parse handles cache automatically
-                    person_response = asyncio.run(
-                        fetch_and_cache_parse(
-                            page_title=person.wikipedia_title,
-                            run_id=run_id,
-                            force=force,
-                            revalidate=False
-                        )
-                    )
+                    was_cached = person.wikipedia_title in cached_titles
+                    person_response = person_responses.get(person.wikipedia_title)
+                    if isinstance(person_response, BaseException):
+                        raise person_response
                     
                     if person_response:
                         if was_cached:
@@ -13,14 +13,17 @@ from scraper.utils.time import utc_now_iso
 
 RULESET_VERSION = "ruleset_v1"
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
 
 def normalize_name(name: str) -> str:
     if not name:
         return ""
     name = name.lower().strip()
-    name = re.sub(r"\s+", " ", name)
+    name = _WHITESPACE_RE.sub(" ", name)
     name = unicodedata.normalize("NFKD", name)
-    name = re.sub(r"[^\w\s]", "", name)
+    name = _NON_WORD_RE.sub("", name)
     return name
 
 
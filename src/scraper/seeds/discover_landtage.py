@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
+import orjson
 from bs4 import BeautifulSoup
 
 from scraper.cache.mediawiki_cache import normalize_title
@@ -19,6 +20,8 @@ from scraper.utils.time import utc_now_iso
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+_WAHLPERIODE_RE = re.compile(r"\((\d+)\.\s*Wahlperiode\)")
+
 
 def normalize_title_for_key(title: str) -> str:
     """Normalize Wikipedia title for use in seed key."""
@@ -28,7 +31,7 @@ def normalize_title_for_key(title: str) -> str:
 def extract_legislature_number(title: str) -> Optional[int]:
     """Extract legislature number from title like 'Liste der Mitglieder ... (17. Wahlperiode)'."""
     # Match patterns like "(17. Wahlperiode)", "(18. Wahlperiode)", etc.
-    match = re.search(r"\((\d+)\.\s*Wahlperiode\)", title)
+    match = _WAHLPERIODE_RE.search(title)
     if match:
         return int(match.group(1))
     return None
@@ -36,7 +39,7 @@ def extract_legislature_number(title: str) -> Optional[int]:
 
 def validate_member_list_table(html: str, expected_keywords: List[str]) -> Tuple[bool, Optional[str]]:
     """Validate that HTML contains a member list table with expected keywords."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     
     # Find all tables
     tables = soup.find_all("table")
@@ -73,6 +76,61 @@ def validate_member_list_table(html: str, expected_keywords: List[str]) -> Tuple
     return False, "No valid member list table found (missing Name + Partei/Wahlkreis columns)"
 
 
+def _parse_cache_path(title: str) -> Path:
+    # Use revision_id 0 as placeholder, we'll get real one from response
+    return settings.scraper_cache_dir / "mediawiki" / normalize_title(title) / "0" / "parse"
+
+
+async def _fetch_page_info(client: Any, title: str, force: bool) -> Tuple[Optional[int], Optional[int]]:
+    """(page_id, revision_id) of title from a cached or fetched info query; page_id None if missing."""
+    # Get page info and revision
+    query_params = {"page_title": title}
+    query_params_hash = sha256_hash_json(query_params)
+    safe_title = normalize_title(f"query_{title}")
+    query_cache_path = settings.scraper_cache_dir / "mediawiki" / safe_title / query_params_hash[:16] / "query"
+    query_raw_path = query_cache_path / "raw.json"
+    query_metadata_path = query_cache_path / "metadata.json"
+
+    if not force and query_raw_path.exists() and query_metadata_path.exists():
+        query_response = orjson.loads(query_raw_path.read_bytes())
+        logger.info(f"Cache hit for query: {title}")
+    else:
+        query_response = await client.fetch_query(title)
+        sha256 = sha256_hash_json(query_response)
+        retrieved_at = utc_now_iso()
+        
+        query_cache_path.mkdir(parents=True, exist_ok=True)
+        with open(query_raw_path, "w", encoding="utf-8") as f:
+            json.dump(query_response, f, ensure_ascii=False, indent=2)
+        
+        metadata = {
+            "request_params": query_params,
+            "response_headers": {},
+            "retrieved_at": retrieved_at,
+            "sha256": sha256,
+            "source_url": f"{client.BASE_URL}?action=query&prop=info|revisions&titles={title}",
+            "endpoint_kind": "query",
+        }
+        with open(query_metadata_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        
+        logger.info(f"Fetched query info for: {title}")
+
+    # Extract page_id and revision_id
+    pages = query_response.get("query", {}).get("pages", {})
+    page_id = None
+    revision_id = None
+    
+    for page_data in pages.values():
+        page_id = page_data.get("pageid")
+        revisions = page_data.get("revisions", [])
+        if revisions:
+            revision_id = revisions[0].get("revid")
+        break
+
+    return page_id, revision_id
+
+
 async def discover_landtage_seeds(
     registry_path: Optional[Path] = None,
     output_path: Optional[Path] = None,
@@ -95,9 +153,9 @@ async def discover_landtage_seeds(
         "errors": [],
     }
 
+    client = get_client()
     try:
         registry = load_registry(registry_path)
-        client = get_client()
         all_seeds: Dict[str, Dict[str, Any]] = {}
         seen_titles: Set[str] = set()
         seen_page_ids: Set[int] = set()
@@ -126,8 +184,7 @@ async def discover_landtage_seeds(
                     metadata_path = cache_path / "metadata.json"
 
                     if not force and raw_path.exists() and metadata_path.exists():
-                        with open(raw_path, "r", encoding="utf-8") as f:
-                            search_response = json.load(f)
+                        search_response = orjson.loads(raw_path.read_bytes())
                         logger.info(f"Cache hit for search: {search_query}")
                     else:
                         search_response = await client.fetch_search(search_query, limit=50)
@@ -188,65 +245,62 @@ async def discover_landtage_seeds(
                 for t in found_titles_for_landtag
             ])
 
-            # Validate each found title
+            # Look up page info of all found titles first, so only existing, not yet seen
+            # pages get their (large) parse responses fetched
+            accepted_titles: List[Dict[str, Any]] = []
             for title_info in found_titles_for_landtag:
                 title = title_info["title"]
-                legislature_number = title_info["legislature_number"]
-                
                 try:
-                    # Get page info and revision
-                    query_params = {"page_title": title}
-                    query_params_hash = sha256_hash_json(query_params)
-                    safe_title = normalize_title(f"query_{title}")
-                    query_cache_path = settings.scraper_cache_dir / "mediawiki" / safe_title / query_params_hash[:16] / "query"
-                    query_raw_path = query_cache_path / "raw.json"
-                    query_metadata_path = query_cache_path / "metadata.json"
-
-                    if not force and query_raw_path.exists() and query_metadata_path.exists():
-                        with open(query_raw_path, "r", encoding="utf-8") as f:
-                            query_response = json.load(f)
-                        logger.info(f"Cache hit for query: {title}")
-                    else:
-                        query_response = await client.fetch_query(title)
-                        sha256 = sha256_hash_json(query_response)
-                        retrieved_at = utc_now_iso()
-                        
-                        query_cache_path.mkdir(parents=True, exist_ok=True)
-                        with open(query_raw_path, "w", encoding="utf-8") as f:
-                            json.dump(query_response, f, ensure_ascii=False, indent=2)
-                        
-                        metadata = {
-                            "request_params": query_params,
-                            "response_headers": {},
-                            "retrieved_at": retrieved_at,
-                            "sha256": sha256,
-                            "source_url": f"{client.BASE_URL}?action=query&prop=info|revisions&titles={title}",
-                            "endpoint_kind": "query",
-                        }
-                        with open(query_metadata_path, "w", encoding="utf-8") as f:
-                            json.dump(metadata, f, ensure_ascii=False, indent=2)
-                        
-                        logger.info(f"Fetched query info for: {title}")
+                    page_id, revision_id = await _fetch_page_info(client, title, force)
+                except Exception as e:
+                    logger.error(f"Validation failed for {title}: {e}")
+                    manifest["rejected"].append({
+                        "title": title,
+                        "reason": f"Error: {e}",
+                    })
+                    manifest["errors"].append(f"Validation error for {title}: {e}")
+                    continue
 
-                    # Extract page_id and revision_id
-                    pages = query_response.get("query", {}).get("pages", {})
-                    page_id = None
-                    revision_id = None
-                    
-                    for page_data in pages.values():
-                        page_id = page_data.get("pageid")
-                        revisions = page_data.get("revisions", [])
-                        if revisions:
-                            revision_id = revisions[0].get("revid")
-                        break
-
-                    if not page_id:
-                        manifest["rejected"].append({
-                            "title": title,
-                            "reason": "Page not found",
-                        })
-                        continue
+                if not page_id:
+                    manifest["rejected"].append({
+                        "title": title,
+                        "reason": "Page not found",
+                    })
+                    continue
+
+                if page_id in seen_page_ids:
+                    logger.info(f"Skipping duplicate page_id {page_id}: {title}")
+                    continue
+
+                accepted_titles.append({**title_info, "page_id": page_id, "revision_id": revision_id})
 
+            # Fetch uncached parse responses concurrently up front, once per page; titles
+            # redirecting to an already prefetched page are fetched later only if needed.
+            # Failed fetches are reported for their title in the validation loop below
+            prefetch_page_ids: Set[int] = set()
+            uncached_titles = []
+            for t in accepted_titles:
+                if t["page_id"] in prefetch_page_ids:
+                    continue
+                prefetch_page_ids.add(t["page_id"])
+                cache_path = _parse_cache_path(t["title"])
+                if force or not (cache_path / "raw.json").exists() or not (cache_path / "metadata.json").exists():
+                    uncached_titles.append(t["title"])
+            prefetched = dict(zip(
+                uncached_titles,
+                await client.fetch_parse_many(uncached_titles, include_sections=True),
+                strict=True,
+            ))
+
+            # Validate each accepted title
+            for title_info in accepted_titles:
+                title = title_info["title"]
+                legislature_number = title_info["legislature_number"]
+                page_id = title_info["page_id"]
+                revision_id = title_info["revision_id"]
+                
+                try:
+                    # An earlier title of the same page may have been validated meanwhile
                     if page_id in seen_page_ids:
                         logger.info(f"Skipping duplicate page_id {page_id}: {title}")
                         continue
@@ -254,18 +308,19 @@ async def discover_landtage_seeds(
                     # Fetch parse to validate table
                     parse_params = {"page_title": title, "include_sections": True}
                     parse_params_hash = sha256_hash_json(parse_params)
-                    safe_title = normalize_title(title)
-                    # Use revision_id 0 as placeholder, we'll get real one from response
-                    parse_cache_path = settings.scraper_cache_dir / "mediawiki" / safe_title / "0" / "parse"
+                    parse_cache_path = _parse_cache_path(title)
                     parse_raw_path = parse_cache_path / "raw.json"
                     parse_metadata_path = parse_cache_path / "metadata.json"
 
                     if not force and parse_raw_path.exists() and parse_metadata_path.exists():
-                        with open(parse_raw_path, "r", encoding="utf-8") as f:
-                            parse_response = json.load(f)
+                        parse_response = orjson.loads(parse_raw_path.read_bytes())
                         logger.info(f"Cache hit for parse: {title}")
                     else:
-                        parse_response = await client.fetch_parse(title, include_sections=True)
+                        parse_response = prefetched.get(title)
+                        if parse_response is None:
+                            parse_response = await client.fetch_parse(title, include_sections=True)
+                        elif isinstance(parse_response, BaseException):
+                            raise parse_response
                         parse_data = parse_response.get("parse", {})
                         actual_revision_id = parse_data.get("revid", 0)
                         
@@ -387,6 +442,9 @@ async def discover_landtage_seeds(
         raise
 
     finally:
+        # Close the pooled connections before asyncio.run() ends the loop
+        await client.aclose()
+
         # Save manifest
         manifest_path = settings.scraper_cache_dir / "manifests" / f"discover_{run_id}.json"
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1,7 +1,11 @@
-import json
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
+
+# Same layout as json.dumps(indent=2, ensure_ascii=False): UTF-8, two-space indent
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 def export_json(data: Dict[str, Any], output_dir: Path, run_id: str | None = None) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -13,9 +17,7 @@ def export_json(data: Dict[str, Any], output_dir: Path, run_id: str | None = Non
 
         output_file = output_dir / f"{entity_type}.json"
         serialized = [entity.model_dump() if hasattr(entity, "model_dump") else entity for entity in entities]
-        output_file.write_text(
-            json.dumps(serialized, indent=2, ensure_ascii=False, default=str), encoding="utf-8"
-        )
+        output_file.write_bytes(orjson.dumps(serialized, default=str, option=_DUMP_OPTIONS))
 
     manifest_file = output_dir / "manifest.json"
     manifest = {
@@ -24,5 +26,5 @@ def export_json(data: Dict[str, Any], output_dir: Path, run_id: str | None = Non
     }
     if run_id:
         manifest["run_id"] = run_id
-    manifest_file.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    manifest_file.write_bytes(orjson.dumps(manifest, option=_DUMP_OPTIONS))
 
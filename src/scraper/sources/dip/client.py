@@ -1,11 +1,13 @@
 import asyncio
-import time
+import threading
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
 
 from scraper.config import get_settings
+from scraper.utils.ratelimit import TokenBucket, api_retry
 
 settings = get_settings()
 
@@ -16,21 +18,49 @@ class DipClient:
         base_url: str,
         api_key: Optional[str] = None,
         rate_limit_rps: float = 2.0,
+        rate_limit_burst: float = 1.0,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.rate_limit_rps = rate_limit_rps
-        self._last_request_time = 0.0
-        self._lock = asyncio.Lock()
+        self._bucket = TokenBucket(rate_limit_rps, capacity=rate_limit_burst)
+        # Loop-bound state per thread, (re)created by _bind_loop() on first use in an event loop
+        self._local = threading.local()
+
+    def _bind_loop(self) -> None:
+        """Create the pooled HTTP client for the running event loop (per thread)."""
+        loop = asyncio.get_running_loop()
+        local = self._local
+        if getattr(local, "loop", None) is not loop:
+            # A client left from an earlier loop is replaced, not closed: its connections
+            # belong to that (usually finished) loop. Owners close the client with
+            # `async with` / aclose() before their loop ends, so normally there is none.
+            local.loop = loop
+            local.http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            )
+
+    async def aclose(self) -> None:
+        """Close pooled connections of the current event loop."""
+        local = self._local
+        http = getattr(local, "http", None)
+        if http is not None and local.loop is asyncio.get_running_loop():
+            await http.aclose()
+        local.http = None
+        local.loop = None
+
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        return self._local.http
 
     async def _rate_limit(self) -> None:
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self._last_request_time
-            min_interval = 1.0 / self.rate_limit_rps
-            if elapsed < min_interval:
-                await asyncio.sleep(min_interval - elapsed)
-            self._last_request_time = time.time()
+        self._bind_loop()
+        # The bucket is thread-safe, so the rate limit holds across concurrent event
+        # loops (e.g. seeds run in threads)
+        await self._bucket.acquire()
 
     def _get_headers(self) -> Dict[str, str]:
         headers: Dict[str, str] = {}
@@ -38,10 +68,7 @@ class DipClient:
             headers["Authorization"] = f"ApiKey {self.api_key}"
         return headers
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+    @api_retry
     async def fetch_person_list(
         self,
         wahlperiode: Optional[List[int]] = None,
@@ -56,19 +83,11 @@ class DipClient:
         if cursor:
             params["cursor"] = cursor
 
-        headers = self._get_headers()
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.base_url}/person", params=params, headers=headers
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._http.get("/person", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+    @api_retry
     async def fetch_person_detail(self, person_id: int) -> Dict[str, Any]:
         await self._rate_limit()
 
@@ -76,20 +95,23 @@ class DipClient:
         if self.api_key:
             params["apikey"] = self.api_key
 
-        headers = self._get_headers()
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.base_url}/person/{person_id}", params=params, headers=headers
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._http.get(f"/person/{person_id}", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
 
+@lru_cache(maxsize=1)
 def get_dip_client() -> DipClient:
+    """Return the process-wide DIP client, so rate limiting and connection pooling are shared."""
     return DipClient(
         base_url=settings.dip_base_url,
         api_key=settings.dip_api_key,
         rate_limit_rps=settings.scraper_rate_limit_rps,
+        rate_limit_burst=settings.scraper_rate_limit_burst,
     )
 
+
+async def aclose_dip_client() -> None:
+    """Close the pooled connections of the shared client, if it was created."""
+    if get_dip_client.cache_info().currsize:
+        await get_dip_client().aclose()
@@ -4,12 +4,16 @@ import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from uuid import uuid5
+
+import orjson
 
 from scraper.config import get_settings
-from scraper.sources.dip.client import get_dip_client
+from scraper.models.domain import DipPersonRecord
+from scraper.sources.dip.client import aclose_dip_client, get_dip_client
 from scraper.sources.dip.types import DipPerson, DipPersonListResponse
-from scraper.utils.hashing import sha256_hash_json
+from scraper.utils.hashing import canonical_json_bytes, sha256_hash, sha256_hash_json
+from scraper.utils.ids import NAMESPACE_PERSON, generate_evidence_id
 from scraper.utils.time import utc_now_iso
 
 logger = logging.getLogger(__name__)
@@ -58,8 +62,9 @@ async def ingest_person_list(
         raw_path = cache_path / "raw.json"
         metadata_path = cache_path / "metadata.json"
 
-        if not force and raw_path.exists():
-            response_json = json.loads(raw_path.read_text(encoding="utf-8"))
+        cache_hit = not force and raw_path.exists()
+        if cache_hit:
+            response_json = orjson.loads(raw_path.read_bytes())
             logger.info(f"Cache hit for DIP person list WP {wahlperiode}, cursor: {cursor}")
         else:
             try:
@@ -74,12 +79,11 @@ async def ingest_person_list(
                 raise
 
             cache_path.mkdir(parents=True, exist_ok=True)
-            sha256 = sha256_hash_json(response_json)
+            raw_bytes = canonical_json_bytes(response_json)
+            sha256 = sha256_hash(raw_bytes)
             retrieved_at = utc_now_iso()
 
-            raw_path.write_text(
-                json.dumps(response_json, ensure_ascii=False, indent=2), encoding="utf-8"
-            )
+            raw_path.write_bytes(raw_bytes)
             logger.info(f"Cache miss - fetched and cached DIP person list WP {wahlperiode}, cursor: {cursor}")
 
             metadata = {
@@ -92,17 +96,14 @@ async def ingest_person_list(
                 "page": page,
                 "cursor": cursor,
             }
-            metadata_path.write_text(json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8")
+            metadata_path.write_text(json.dumps(metadata, ensure_ascii=False), encoding="utf-8")
         
         # Update evidence index for DIP responses (both cache hit and miss)
         from scraper.cache.evidence_index import update_evidence_index
-        from scraper.utils.ids import generate_evidence_id
         
         # Load metadata to get sha256 if cache hit
-        if not force and raw_path.exists():
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                metadata_loaded = json.load(f)
-                sha256 = metadata_loaded.get("sha256")
+        if cache_hit:
+            sha256 = orjson.loads(metadata_path.read_bytes()).get("sha256")
         
         # Generate evidence_id for this DIP response
         evidence_id = generate_evidence_id(
@@ -143,5 +144,35 @@ def ingest_person_list_sync(
     run_id: str,
     force: bool = False,
 ) -> List[DipPerson]:
-    return asyncio.run(ingest_person_list(wahlperiode, run_id, force=force))
-
+    async def _run() -> List[DipPerson]:
+        try:
+            return await ingest_person_list(wahlperiode, run_id, force=force)
+        finally:
+            await aclose_dip_client()
+
+    return asyncio.run(_run())
+
+
+def build_dip_person_records(dip_persons: List[DipPerson]) -> List[DipPersonRecord]:
+    """
+    Convert ingested DIP persons into DipPersonRecords for reconciliation.
+
+    The id is derived from the DIP person id, the evidence_id from the payload hash.
+    Fields come from already validated DipPerson models, so records skip re-validation.
+    """
+    construct = DipPersonRecord.model_construct
+    return [
+        construct(
+            id=str(uuid5(NAMESPACE_PERSON, f"dip:{p.id}")),
+            dip_person_id=p.id,
+            vorname=p.vorname,
+            nachname=p.nachname,
+            namenszusatz=p.namenszusatz,
+            titel=p.titel,
+            fraktion=p.fraktion,
+            wahlperiode=p.wahlperiode,
+            person_roles=p.person_roles,
+            evidence_ids=[generate_evidence_id(0, 0, "dip_person", sha256_hash_json(p.model_dump()))],
+        )
+        for p in dip_persons
+    ]
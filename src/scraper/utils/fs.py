@@ -0,0 +1,57 @@
+import gzip
+import mmap
+from pathlib import Path
+from typing import Any, Optional, Set
+
+import orjson
+
+# Directories already created (or known to exist) in this process.
+_CREATED_DIRS: Set[Path] = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    """Create path (with parents) once per process; later calls are a set lookup."""
+    if path not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(path)
+    return path
+
+
+# Cached raw responses are stored either plain or gzip-compressed (SCRAPER_CACHE_COMPRESS).
+RAW_FILENAME = "raw.json"
+RAW_GZ_FILENAME = "raw.json.gz"
+
+
+def find_raw_path(cache_path: Path) -> Optional[Path]:
+    """Return the cached raw response file in cache_path, or None if neither variant exists."""
+    for name in (RAW_FILENAME, RAW_GZ_FILENAME):
+        raw_path = cache_path / name
+        if raw_path.exists():
+            return raw_path
+    return None
+
+
+def read_raw_bytes(raw_path: Path) -> bytes:
+    """Read a cached raw response, decompressing raw.json.gz."""
+    data = raw_path.read_bytes()
+    if raw_path.suffix == ".gz":
+        return gzip.decompress(data)
+    return data
+
+
+# Below this size a plain read() is cheaper than setting up a memory map.
+MMAP_MIN_BYTES = 64 * 1024
+
+
+def load_raw_json(raw_path: Path) -> Any:
+    """
+    Parse a cached raw response.
+
+    Large uncompressed files are memory-mapped and parsed straight from the page cache
+    instead of being copied into a bytes buffer first.
+    """
+    if raw_path.suffix == ".gz" or raw_path.stat().st_size < MMAP_MIN_BYTES:
+        return orjson.loads(read_raw_bytes(raw_path))
+    with open(raw_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
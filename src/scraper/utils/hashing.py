@@ -1,4 +1,5 @@
 import hashlib
+import json
 from typing import Any
 
 
@@ -6,9 +7,16 @@ def sha256_hash(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def sha256_hash_json(obj: Any) -> str:
-    import json
+def canonical_json_bytes(obj: Any) -> bytes:
+    """
+    Serialize obj in the canonical form hashed by sha256_hash_json.
+
+    The exact bytes (stdlib separators, sorted keys, no ASCII escaping) feed into
+    evidence IDs, so they must not change; a faster encoder such as orjson emits
+    different bytes and would re-key all existing evidence.
+    """
+    return json.dumps(obj, sort_keys=True, ensure_ascii=False).encode("utf-8")
 
-    json_bytes = json.dumps(obj, sort_keys=True, ensure_ascii=False).encode("utf-8")
-    return sha256_hash(json_bytes)
 
+def sha256_hash_json(obj: Any) -> str:
+    return sha256_hash(canonical_json_bytes(obj))
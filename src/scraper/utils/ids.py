@@ -1,5 +1,7 @@
+import hashlib
 import uuid
-from typing import Literal
+from functools import lru_cache
+from typing import Callable, Literal
 
 NAMESPACE_PERSON = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
 NAMESPACE_LEGISLATURE = uuid.UUID("6ba7b811-9dad-11d1-80b4-00c04fd430c8")
@@ -8,25 +10,53 @@ NAMESPACE_MANDATE = uuid.UUID("6ba7b813-9dad-11d1-80b4-00c04fd430c8")
 NAMESPACE_EVIDENCE = uuid.UUID("6ba7b814-9dad-11d1-80b4-00c04fd430c8")
 
 
+def _uuid5_in(namespace: uuid.UUID) -> Callable[[str], str]:
+    """
+    Return a str(uuid.uuid5(namespace, name)) equivalent for one namespace.
+
+    uuid5 is SHA-1 over namespace bytes + name; the namespace prefix is hashed once
+    and the context copied per ID instead of hashing the concatenation every time.
+    """
+    prefix = hashlib.sha1(namespace.bytes)
+
+    def uuid5(name: str) -> str:
+        h = prefix.copy()
+        h.update(name.encode("utf-8"))
+        return str(uuid.UUID(bytes=h.digest()[:16], version=5))
+
+    return uuid5
+
+
+_person_uuid5 = _uuid5_in(NAMESPACE_PERSON)
+_legislature_uuid5 = _uuid5_in(NAMESPACE_LEGISLATURE)
+_party_uuid5 = _uuid5_in(NAMESPACE_PARTY)
+_mandate_uuid5 = _uuid5_in(NAMESPACE_MANDATE)
+_evidence_uuid5 = _uuid5_in(NAMESPACE_EVIDENCE)
+
+
 def generate_person_id(wikipedia_title: str) -> str:
-    return str(uuid.uuid5(NAMESPACE_PERSON, wikipedia_title.lower().strip()))
+    return _person_uuid5(wikipedia_title.lower().strip())
 
 
+# Called with the same seed hints for every row of a member list
+@lru_cache(maxsize=256)
 def generate_legislature_id(parliament: str, state: str, number: int) -> str:
     key = f"{parliament}|{state}|{number}"
-    return str(uuid.uuid5(NAMESPACE_LEGISLATURE, key))
+    return _legislature_uuid5(key)
 
 
+# A handful of parties recur across all mandates
+@lru_cache(maxsize=256)
 def generate_party_id(party_name: str) -> str:
-    return str(uuid.uuid5(NAMESPACE_PARTY, party_name.strip().lower()))
+    return _party_uuid5(party_name.strip().lower())
 
 
 def generate_mandate_id(person_id: str, legislature_id: str, start: str, end: str, role: str = "") -> str:
     key = f"{person_id}|{legislature_id}|{start}|{end}|{role}"
-    return str(uuid.uuid5(NAMESPACE_MANDATE, key))
+    return _mandate_uuid5(key)
 
 
 def generate_evidence_id(page_id: int, revision_id: int, endpoint_kind: str, sha256: str) -> str:
     key = f"{page_id}|{revision_id}|{endpoint_kind}|{sha256}"
-    return str(uuid.uuid5(NAMESPACE_EVIDENCE, key))
+    return _evidence_uuid5(key)
 
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+from tenacity.wait import wait_base
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter, shared by all threads and event loops that use it.
+
+    Tokens refill at `rate` per second up to `capacity` (the burst size). Each request
+    takes one token; when none is left, it reserves the next one and sleeps until it has
+    refilled. Only the bookkeeping runs under the lock, never the sleep, so concurrent
+    requests are limited by the rate alone. capacity=1 spaces requests evenly.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            # Negative tokens are reservations of requests still waiting for a refill
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# Longest Retry-After delay that is honored; longer requested delays are capped to it
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Transport errors, rate limiting (429) and server errors (5xx) are worth retrying."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_after_seconds(exc: Optional[BaseException]) -> Optional[float]:
+    """Delay requested by the Retry-After header of a 429/503 response (seconds or HTTP date)."""
+    if not isinstance(exc, httpx.HTTPStatusError) or exc.response.status_code not in (429, 503):
+        return None
+    value = exc.response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+class wait_retry_after(wait_base):
+    """Wait as long as the server's Retry-After asks for, but at least the fallback backoff."""
+
+    def __init__(self, fallback: wait_base):
+        self.fallback = fallback
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        backoff = self.fallback(retry_state)
+        retry_after = _retry_after_seconds(retry_state.outcome.exception())
+        return max(retry_after, backoff) if retry_after is not None else backoff
+
+
+# Retry policy of the API clients: jittered exponential backoff, so concurrent requests
+# that failed together do not retry in lockstep, honoring Retry-After when rate limited
+api_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_retry_after(wait_random_exponential(multiplier=1, max=30)),
+    retry=retry_if_exception(_is_retryable),
+)
@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import quote, urlencode
 
 from scraper.config import get_settings
@@ -6,6 +7,7 @@ from scraper.config import get_settings
 settings = get_settings()
 
 
+@lru_cache(maxsize=4096)
 def build_wikipedia_canonical_url(page_title: str, revision_id: Optional[int] = None) -> str:
     """
     Build canonical Wikipedia URL with oldid parameter for reproducibility.
@@ -26,14 +28,25 @@ def build_dip_canonical_url(endpoint: str, params: Optional[Dict[str, Any]] = No
     """
     Build canonical DIP URL from endpoint and params.
     
-    Uses DIP_BASE_URL from settings.
+    Uses DIP_BASE_URL from settings. Results are cached per (base URL, endpoint, params).
     """
-    base_url = settings.dip_base_url.rstrip("/")
-    endpoint_clean = endpoint.lstrip("/")
-    url = f"{base_url}/{endpoint_clean}"
+    items = tuple(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in (params or {}).items()
+    )
+    try:
+        return _build_dip_canonical_url(settings.dip_base_url, endpoint, items)
+    except TypeError:  # unhashable param value
+        return _build_dip_canonical_url.__wrapped__(settings.dip_base_url, endpoint, items)
+
+
+@lru_cache(maxsize=4096)
+def _build_dip_canonical_url(
+    base_url: str, endpoint: str, items: Tuple[Tuple[str, Any], ...]
+) -> str:
+    url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
     
-    if params:
-        query_string = urlencode(params, doseq=True)
+    if items:
+        query_string = urlencode(items, doseq=True)
         url = f"{url}?{query_string}"
     
     return url
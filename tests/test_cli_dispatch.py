@@ -0,0 +1,17 @@
+from importlib import import_module
+
+from scraper.cli import COMMANDS, build_app
+
+
+def test_static_help_matches_command_docstrings():
+    for name, help_text in COMMANDS.items():
+        run = import_module(f"scraper.cli._cmd_{name}").run
+        assert run.__doc__.strip() == help_text
+
+
+def test_build_app_registers_only_requested_command():
+    app = build_app(["scraper", "seed", "--validate"])
+    assert [c.name for c in app.registered_commands] == ["seed"]
+
+    app = build_app(["scraper", "--help"])
+    assert [c.name for c in app.registered_commands] == list(COMMANDS)
@@ -0,0 +1,137 @@
+import json
+
+from scraper.cache import evidence_index
+from scraper.cache.evidence_index import (
+    compact_evidence_index,
+    dump_to_jsonl,
+    get_evidence_index_db_path,
+    get_evidence_index_entry,
+    get_evidence_index_meta_path,
+    get_evidence_index_path,
+    lookup_evidence_index_entry,
+    update_evidence_index,
+)
+
+
+def _read_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def test_update_appends_and_compact_keeps_last(tmp_path, monkeypatch):
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+
+    update_evidence_index("ev-1", "mediawiki", tmp_path / "m1.json", tmp_path / "r1.json", sha256="a")
+    update_evidence_index("ev-2", "mediawiki", tmp_path / "m2.json", tmp_path / "r2.json", sha256="b")
+    update_evidence_index("ev-1", "mediawiki", tmp_path / "m1.json", tmp_path / "r1.json", sha256="c")
+
+    index_path = get_evidence_index_path()
+    assert len(_read_lines(index_path)) == 3
+
+    compact_evidence_index()
+
+    entries = _read_lines(index_path)
+    assert [e["evidence_id"] for e in entries] == ["ev-1", "ev-2"]
+    assert entries[0]["sha256"] == "c"
+    assert json.loads(get_evidence_index_meta_path().read_text())["appended_since_compaction"] == 0
+
+
+def test_update_compacts_after_threshold(tmp_path, monkeypatch):
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    monkeypatch.setattr(evidence_index, "COMPACT_AFTER_APPENDS", 3)
+
+    for sha in ("a", "b", "c"):
+        update_evidence_index("ev-1", "mediawiki", tmp_path / "m.json", tmp_path / "r.json", sha256=sha)
+
+    entries = _read_lines(get_evidence_index_path())
+    assert len(entries) == 1
+    assert entries[0]["sha256"] == "c"
+
+
+def test_sqlite_sidecar_lookup_and_dump(tmp_path, monkeypatch):
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+
+    update_evidence_index("ev-1", "dip", tmp_path / "m.json", tmp_path / "r.json", sha256="a",
+                          endpoint="/person", params={"f.wahlperiode": [19]})
+    update_evidence_index("ev-1", "dip", tmp_path / "m.json", tmp_path / "r.json", sha256="b",
+                          endpoint="/person", params={"f.wahlperiode": [19]})
+
+    entry = get_evidence_index_entry("ev-1")
+    assert entry["sha256"] == "b"
+    assert entry["params"] == {"f.wahlperiode": [19]}
+    assert get_evidence_index_entry("missing") is None
+
+    out = tmp_path / "dump.jsonl"
+    assert dump_to_jsonl(out) == 1
+    assert _read_lines(out)[0]["sha256"] == "b"
+
+
+def test_load_evidence_index_reused_until_file_changes(tmp_path, monkeypatch):
+    from scraper.evidence.backends import file_cache
+
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+
+    update_evidence_index("ev-1", "mediawiki", tmp_path / "m1.json", tmp_path / "r1.json", sha256="a")
+    first = file_cache.load_evidence_index()
+    assert file_cache.load_evidence_index() is first
+
+    update_evidence_index("ev-2", "mediawiki", tmp_path / "m2.json", tmp_path / "r2.json", sha256="b")
+    second = file_cache.load_evidence_index()
+    assert second is not first
+    assert set(second) == {"ev-1", "ev-2"}
+
+
+def _append_jsonl(path, *entries):
+    with open(path, "a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def test_lookup_builds_sidecar_from_jsonl(tmp_path, monkeypatch):
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    index_path = get_evidence_index_path()
+    _append_jsonl(index_path, {"evidence_id": "ev-1", "sha256": "a"}, {"evidence_id": "ev-1", "sha256": "b"})
+    assert not get_evidence_index_db_path().exists()
+
+    assert lookup_evidence_index_entry("ev-1") == {"evidence_id": "ev-1", "sha256": "b"}
+    assert get_evidence_index_db_path().exists()
+
+
+def test_lookup_resyncs_after_external_jsonl_append(tmp_path, monkeypatch):
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    update_evidence_index("ev-1", "mediawiki", tmp_path / "m1.json", tmp_path / "r1.json", sha256="a")
+    assert lookup_evidence_index_entry("ev-1")["sha256"] == "a"
+
+    # Written by another tool, bypassing the sidecar: mtime and size change
+    _append_jsonl(
+        get_evidence_index_path(),
+        {"evidence_id": "ev-1", "sha256": "b"},
+        {"evidence_id": "ev-2", "sha256": "c"},
+    )
+
+    assert lookup_evidence_index_entry("ev-1")["sha256"] == "b"
+    assert lookup_evidence_index_entry("ev-2")["sha256"] == "c"
+
+
+def test_lookup_consistent_after_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    update_evidence_index("ev-1", "mediawiki", tmp_path / "m1.json", tmp_path / "r1.json", sha256="a")
+    update_evidence_index("ev-2", "mediawiki", tmp_path / "m2.json", tmp_path / "r2.json", sha256="b")
+    update_evidence_index("ev-1", "mediawiki", tmp_path / "m1.json", tmp_path / "r1.json", sha256="c")
+    assert lookup_evidence_index_entry("ev-1")["sha256"] == "c"
+
+    compact_evidence_index()
+
+    assert lookup_evidence_index_entry("ev-1")["sha256"] == "c"
+    assert lookup_evidence_index_entry("ev-2")["sha256"] == "b"
+
+    # The compacted JSONL is still tracked: a later external append is picked up
+    _append_jsonl(get_evidence_index_path(), {"evidence_id": "ev-2", "sha256": "d"})
+    assert lookup_evidence_index_entry("ev-2")["sha256"] == "d"
+
+
+def test_lookup_missing_id_or_index_returns_none(tmp_path, monkeypatch):
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    assert lookup_evidence_index_entry("ev-1") is None
+
+    update_evidence_index("ev-1", "mediawiki", tmp_path / "m1.json", tmp_path / "r1.json", sha256="a")
+    assert lookup_evidence_index_entry("missing") is None
@@ -116,3 +116,30 @@ def test_resolve_nonexistent_evidence(resolver):
     
     assert len(resolved) == 0
 
+
+
+def test_scan_fallback_persists_to_index_sidecar(tmp_path, monkeypatch):
+    """Evidence missing from the JSONL index is found by a cache scan, then by keyed lookup."""
+    from scraper.cache import evidence_index
+    from scraper.evidence.backends import file_cache
+    from scraper.utils.ids import generate_evidence_id
+
+    monkeypatch.setattr(file_cache.settings, "scraper_cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path / "cache")
+
+    parse_dir = tmp_path / "cache" / "mediawiki" / "Stephan_Weil" / "123456789" / "parse"
+    parse_dir.mkdir(parents=True)
+    (parse_dir / "metadata.json").write_text(
+        json.dumps({"page_title": "Stephan_Weil", "page_id": 12345, "revision_id": 123456789, "sha256": "abc123"}),
+        encoding="utf-8",
+    )
+    (parse_dir / "raw.json").write_text(json.dumps({"parse": {"text": {"*": ""}}}), encoding="utf-8")
+    evidence_id = generate_evidence_id(12345, 123456789, "parse", "abc123")
+
+    entry = file_cache.scan_cache_for_evidence_id(evidence_id)
+    assert entry["cache_metadata_path"] == str(parse_dir / "metadata.json")
+    assert file_cache.scan_cache_for_evidence_id("unknown-id") is None
+
+    stored = evidence_index.get_evidence_index_entry(evidence_id)
+    assert stored["page_title"] == "Stephan_Weil"
+    assert stored["sha256"] == "abc123"
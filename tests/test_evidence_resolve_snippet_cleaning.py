@@ -1,6 +1,11 @@
 import pytest
 
-from scraper.evidence.snippets import clean_snippet_text, extract_lead_paragraph
+from scraper.evidence.snippets import (
+    LEAD_SLICE_CHARS,
+    clean_snippet_text,
+    extract_lead_paragraph,
+    extract_table_row_snippet,
+)
 
 
 def test_clean_snippet_text_removes_footnotes():
@@ -58,3 +63,32 @@ def test_extract_lead_paragraph_no_content():
     
     assert snippet is None
 
+
+
+def test_extract_lead_paragraph_large_page_matches_full_parse():
+    """Test that slicing large pages finds the same lead paragraph, also beyond the slice."""
+    lead = "This is the lead paragraph with sufficient content to be selected as the lead paragraph."
+    filler = "<p>x</p>" * (LEAD_SLICE_CHARS // 8 + 1)
+
+    early = f'<div class="mw-parser-output"><p>Short.</p><p>{lead}</p>{filler}</div>'
+    late = f'<div class="mw-parser-output"><p>Short.</p>{filler}<p>{lead}</p></div>'
+
+    assert extract_lead_paragraph(early) == lead
+    assert extract_lead_paragraph(late) == lead
+
+
+def test_snippets_skip_inline_style_and_script_text():
+    """Test that TemplateStyles CSS and scripts do not end up in snippets."""
+    lead = "This is the lead paragraph with sufficient content to be selected as the lead paragraph."
+    html = f'''
+    <div class="mw-parser-output">
+        <p><style data-mw-deduplicate="TemplateStyles:r1">.x{{color:red}}</style>{lead}<script>var y;</script></p>
+        <table class="wikitable">
+            <tr><th>Name</th><th>Partei</th></tr>
+            <tr><td><style>.x{{}}</style>A</td><td>B</td></tr>
+        </table>
+    </div>
+    '''
+
+    assert extract_lead_paragraph(html) == lead
+    assert extract_table_row_snippet(html, {"type": "table_row", "table_index": 0, "row_index": 0}) == "A | B"
@@ -148,3 +148,42 @@ def test_table_row_snippet_contains_name_and_party(resolver, sample_table_row_ev
     assert "Stephan Weil" in snippet or "Stephan" in snippet
     assert "SPD" in snippet
 
+
+
+def test_resolve_refs_same_page_keeps_input_order(resolver, sample_table_row_evidence_index):
+    """Refs to one page are resolved together, each with its own row and purpose."""
+    from scraper.models.domain import EvidenceRef
+
+    def row_ref(row_index):
+        return EvidenceRef(
+            evidence_id=sample_table_row_evidence_index,
+            snippet_ref={"version": 1, "type": "table_row", "table_index": 0, "row_index": row_index},
+            purpose=f"row_{row_index}",
+        )
+
+    refs = [row_ref(1), EvidenceRef(evidence_id="missing-id", purpose="missing"), row_ref(0)]
+    resolved = resolver.resolve_refs(refs, with_snippets=True)
+
+    assert [e.purpose for e in resolved] == ["row_1", "row_0"]
+    assert "Other Person" in resolved[0].snippet
+    assert "Stephan Weil" in resolved[1].snippet
+
+
+def test_page_not_loaded_when_snippet_ref_does_not_apply(sample_table_row_evidence_index, monkeypatch):
+    """A non-table_row snippet_ref with table_row preference never needs the page."""
+    from scraper.evidence.backends import file_cache
+
+    def fail(*args):
+        raise AssertionError("raw.json should not be loaded")
+
+    monkeypatch.setattr(file_cache, "_load_parsed_html", fail)
+
+    resolved = file_cache.resolve_from_file_cache(
+        sample_table_row_evidence_index,
+        with_snippet=True,
+        prefer_snippet="table_row",
+        snippet_ref={"version": 1, "type": "infobox"},
+    )
+
+    assert resolved is not None
+    assert resolved.snippet is None
@@ -0,0 +1,188 @@
+import asyncio
+import gzip
+import json
+
+from scraper.cache import evidence_index, mediawiki_cache
+from scraper.cache.mediawiki_cache import (
+    batch_fetch_revisions,
+    fetch_and_cache_parse,
+    fetch_pages_async,
+    get_cache_path,
+    get_cached_metadata,
+    get_latest_manifest_path,
+)
+from scraper.utils.hashing import sha256_hash_json
+
+PARSE_RESPONSE = {
+    "parse": {
+        "title": "Max Mustermann",
+        "pageid": 4711,
+        "revid": 99,
+        "displaytitle": "Max Mustermann",
+        "text": {"*": '<div class="mw-parser-output"><p>Max Mustermann ist ein Politiker.</p></div>'},
+    }
+}
+
+
+class FakeClient:
+    BASE_URL = "https://de.wikipedia.org/w/api.php"
+
+    def __init__(self, etag=None):
+        self.parse_calls = 0
+        self.query_batches = []
+        self.etag = etag
+        self.sent_etags = []
+
+    async def fetch_parse(self, page_title, include_sections=False):
+        self.parse_calls += 1
+        return json.loads(json.dumps(PARSE_RESPONSE))
+
+    async def fetch_parse_conditional(self, page_title, include_sections=False, etag=None, last_modified=None):
+        self.sent_etags.append(etag)
+        validators = {"etag": self.etag, "last_modified": None}
+        if etag is not None and etag == self.etag:
+            return None, validators
+        return await self.fetch_parse(page_title, include_sections), validators
+
+    async def fetch_query_batch(self, page_titles):
+        self.query_batches.append(list(page_titles))
+        return {
+            "query": {
+                "normalized": [{"from": "Max_Mustermann", "to": "Max Mustermann"}],
+                "pages": {
+                    "4711": {"pageid": 4711, "title": "Max Mustermann", "revisions": [{"revid": 99}]},
+                    "-1": {"title": "Gibt Es Nicht", "missing": ""},
+                },
+            }
+        }
+
+
+def test_fetch_and_cache_parse_writes_cache_and_hits_it(tmp_path, monkeypatch):
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_dir", tmp_path)
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    client = FakeClient()
+
+    response = asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-1", client=client))
+
+    assert response.page_id == 4711
+    assert response.revision_id == 99
+    raw_path = get_cache_path("Max Mustermann", 99, "parse") / "raw.json"
+    assert json.loads(raw_path.read_text(encoding="utf-8")) == PARSE_RESPONSE
+    assert get_latest_manifest_path("Max Mustermann").exists()
+
+    metadata = get_cached_metadata("Max Mustermann")
+    assert metadata.sha256 == sha256_hash_json(PARSE_RESPONSE)
+
+    cached = asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-2", client=client))
+    assert cached.html == response.html
+    assert client.parse_calls == 1
+
+
+def test_forced_refetch_of_unchanged_content_skips_rewrite(tmp_path, monkeypatch):
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_dir", tmp_path)
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    client = FakeClient()
+
+    asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-1", client=client))
+    raw_path = get_cache_path("Max Mustermann", 99, "parse") / "raw.json"
+    raw_mtime = raw_path.stat().st_mtime_ns
+    index_path = evidence_index.get_evidence_index_path()
+    index_lines = index_path.read_text(encoding="utf-8").splitlines()
+
+    response = asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-2", force=True, client=client))
+
+    assert client.parse_calls == 2
+    assert response.revision_id == 99
+    assert raw_path.stat().st_mtime_ns == raw_mtime
+    assert index_path.read_text(encoding="utf-8").splitlines() == index_lines
+
+
+def test_revalidate_sends_etag_and_reuses_cache_on_304(tmp_path, monkeypatch):
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_dir", tmp_path)
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    client = FakeClient(etag='"rev-99"')
+
+    asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-1", client=client))
+    assert get_cached_metadata("Max Mustermann").etag == '"rev-99"'
+
+    # FakeClient has no fetch_query: the conditional GET replaces the revision check
+    response = asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-2", revalidate=True, client=client))
+
+    assert client.sent_etags == [None, '"rev-99"']
+    assert client.parse_calls == 1
+    assert response.revision_id == 99
+    assert response.html == PARSE_RESPONSE["parse"]["text"]["*"]
+
+
+def test_forced_refetch_ignores_cached_etag(tmp_path, monkeypatch):
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_dir", tmp_path)
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    client = FakeClient(etag='"rev-99"')
+
+    asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-1", client=client))
+    asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-2", force=True, client=client))
+
+    assert client.sent_etags == [None, None]
+    assert client.parse_calls == 2
+
+
+def test_compressed_raw_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_dir", tmp_path)
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_compress", True)
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    client = FakeClient()
+
+    response = asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-1", client=client))
+
+    cache_path = get_cache_path("Max Mustermann", 99, "parse")
+    assert not (cache_path / "raw.json").exists()
+    assert json.loads(gzip.decompress((cache_path / "raw.json.gz").read_bytes())) == PARSE_RESPONSE
+
+    cached = asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-2", client=client))
+    assert cached.html == response.html
+    assert client.parse_calls == 1
+
+
+def test_batch_fetch_revisions_maps_normalized_and_missing_titles():
+    client = FakeClient()
+
+    revisions = asyncio.run(
+        batch_fetch_revisions(["Max_Mustermann", "Gibt Es Nicht", "Max Mustermann"], client=client, batch_size=2)
+    )
+
+    assert revisions == {"Max_Mustermann": 99, "Gibt Es Nicht": None, "Max Mustermann": 99}
+    assert client.query_batches == [["Max_Mustermann", "Gibt Es Nicht"], ["Max Mustermann"]]
+
+
+def test_revalidate_batch_reuses_current_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_dir", tmp_path)
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    client = FakeClient()
+    asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-1", client=client))
+
+    results = asyncio.run(fetch_pages_async(["Max Mustermann"], "run-2", revalidate=True, client=client))
+
+    assert results[0].revision_id == 99
+    assert client.parse_calls == 1
+    assert len(client.query_batches) == 1
+
+
+def test_revalidate_batch_failure_falls_back_to_per_title_query(tmp_path, monkeypatch):
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_dir", tmp_path)
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+    client = FakeClient()
+    asyncio.run(fetch_and_cache_parse("Max Mustermann", "run-1", client=client))
+
+    async def failing_batch(page_titles):
+        raise RuntimeError("batch query failed")
+
+    async def fetch_query(page_title):
+        return {"query": {"pages": {"4711": {"pageid": 4711, "title": page_title, "revisions": [{"revid": 99}]}}}}
+
+    client.fetch_query_batch = failing_batch
+    client.fetch_query = fetch_query
+
+    results = asyncio.run(fetch_pages_async(["Max Mustermann"], "run-2", revalidate=True, client=client))
+
+    assert results[0].revision_id == 99
+    assert client.parse_calls == 1
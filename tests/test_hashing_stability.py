@@ -0,0 +1,32 @@
+import uuid
+
+from scraper.utils.hashing import canonical_json_bytes, sha256_hash_json
+from scraper.utils.ids import (
+    NAMESPACE_EVIDENCE,
+    NAMESPACE_LEGISLATURE,
+    NAMESPACE_PERSON,
+    generate_evidence_id,
+    generate_legislature_id,
+    generate_person_id,
+)
+
+
+def test_canonical_json_bytes_format_is_stable():
+    obj = {"nachname": "Müller", "id": 7, "wahlperiode": [19, 20], "fraktion": None}
+
+    assert canonical_json_bytes(obj) == (
+        '{"fraktion": null, "id": 7, "nachname": "Müller", "wahlperiode": [19, 20]}'.encode()
+    )
+    # Evidence IDs are derived from this digest; changing it re-keys all evidence
+    assert sha256_hash_json(obj) == "e0e012fb157beabb26696274d94cef177df399de3dffc474b952260b6e7086b8"
+
+
+def test_generated_ids_match_uuid5():
+    """IDs are persisted in the sinks; the prefix-hashing shortcut must equal uuid.uuid5."""
+    assert generate_person_id(" Max Müller ") == str(uuid.uuid5(NAMESPACE_PERSON, "max müller"))
+    assert generate_legislature_id("Landtag", "Niedersachsen", 17) == str(
+        uuid.uuid5(NAMESPACE_LEGISLATURE, "Landtag|Niedersachsen|17")
+    )
+    assert generate_evidence_id(4711, 99, "parse", "abc") == str(
+        uuid.uuid5(NAMESPACE_EVIDENCE, "4711|99|parse|abc")
+    )
@@ -0,0 +1,19 @@
+import asyncio
+
+from scraper.mediawiki.client import MediaWikiClient
+
+
+def test_client_binds_and_closes_one_http_client_per_event_loop():
+    client = MediaWikiClient(user_agent="test-agent")
+
+    async def use():
+        async with client:
+            return client._http
+
+    first = asyncio.run(use())
+    second = asyncio.run(use())
+
+    assert first is not second
+    assert first.is_closed
+    assert second.is_closed
+    assert client._local.http is None
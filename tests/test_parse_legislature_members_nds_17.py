@@ -4,7 +4,7 @@ from pathlib import Path
 import pytest
 
 from scraper.mediawiki.types import MediaWikiParseResponse
-from scraper.parsers.legislature_members import parse_legislature_members
+from scraper.parsers.legislature_members import parse_date_safe, parse_legislature_members
 
 
 @pytest.fixture
@@ -50,3 +50,12 @@ nds_lt_17:
     assert mandate.party_name == "SPD"
     assert mandate.wahlkreis == "Hannover"
 
+
+
+def test_parse_date_safe_german_formats():
+    assert parse_date_safe("1. Januar 1990") == "1990-01-01"
+    assert parse_date_safe("seit 14. Oktober 2022") == "2022-10-14"
+    assert parse_date_safe("01.02.1990") == "1990-02-01"
+    assert parse_date_safe("2003-04-05") == "2003-04-05"
+    assert parse_date_safe("31.02.2000") is None
+    assert parse_date_safe("") is None
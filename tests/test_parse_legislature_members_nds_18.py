@@ -52,3 +52,40 @@ nds_lt_18:
     assert "Test Person 18" in person.name
     assert mandate.party_name == "CDU"
 
+
+
+def test_parse_legislature_members_heading_fallback(tmp_path, monkeypatch):
+    """A table without a name/party header is still found after a matching heading."""
+    import scraper.cache.mediawiki_cache as cache_module
+
+    html_content = """
+    <div class="mw-parser-output">
+    <table class="wikitable"><tr><th>Jahr</th><th>Ereignis</th></tr><tr><td>2017</td><td>Wahl</td></tr></table>
+    <h2>Abgeordnete</h2>
+    <table class="wikitable">
+    <tr><th>Abgeordneter</th><th>Liste</th></tr>
+    <tr><td><a href="/wiki/Test_Person_H" title="Test Person H">Test Person H</a></td><td>SPD</td></tr>
+    </table>
+    </div>
+    """
+    response = MediaWikiParseResponse(
+        parse={"pageid": 1, "revid": 2, "title": "Test Page H", "text": {"*": html_content}},
+        page_id=1,
+        revision_id=2,
+        page_title="Test Page H",
+        html=html_content,
+        displaytitle="Test Page H",
+    )
+    seeds_file = tmp_path / "seeds.yaml"
+    seeds_file.write_text(
+        "nds_lt_h:\n  key: nds_lt_h\n  page_title: \"Test Page H\"\n"
+        "  hints:\n    state: \"Niedersachsen\"\n    legislature_number: 18\n"
+    )
+    monkeypatch.setattr(cache_module, "SEEDS_FILE", seeds_file)
+
+    result = parse_legislature_members(response, "nds_lt_h")
+
+    assert len(result.members) == 1
+    person, mandate = result.members[0]
+    assert person.name == "Test Person H"
+    assert mandate.evidence_refs[0].snippet_ref["table_index"] == 1
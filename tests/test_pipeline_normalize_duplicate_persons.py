@@ -0,0 +1,76 @@
+from scraper.cache import evidence_index, mediawiki_cache
+from scraper.config import get_settings
+from scraper.mediawiki.types import MediaWikiParseResponse
+from scraper.parsers import person_page
+from scraper.parsers.legislature_members import parse_legislature_members
+from scraper.pipeline.run import PipelineRunner
+
+# Anna Beispiel has two rows (left and returned), so two mandates for one person
+HTML = """
+<table class="wikitable">
+<tr><th>Name</th><th>Partei</th><th>Wahlkreis</th></tr>
+<tr><td><a href="/wiki/Anna_Beispiel" title="Anna Beispiel">Anna Beispiel</a></td><td>SPD</td><td>Hannover</td></tr>
+<tr><td><a href="/wiki/Anna_Beispiel" title="Anna Beispiel">Anna Beispiel</a></td><td>SPD</td><td>Celle</td></tr>
+</table>
+"""
+
+SEED_DATA = {
+    "key": "nds_lt_dup",
+    "page_title": "Test Page Dup",
+    "expected_time_range": {"start": "2017-11-14", "end": "2022-11-07"},
+    "hints": {"parliament": "Niedersächsischer Landtag", "state": "Niedersachsen", "legislature_number": 18},
+}
+
+PERSON_HTML = '<div class="mw-parser-output"><p>Anna Beispiel ist eine Politikerin.</p></div>'
+
+
+def _parse_response(title, html, page_id):
+    return MediaWikiParseResponse(
+        parse={"pageid": page_id, "revid": page_id + 1, "title": title, "text": {"*": html}},
+        page_id=page_id,
+        revision_id=page_id + 1,
+        page_title=title,
+        html=html,
+        displaytitle=title,
+    )
+
+
+def test_normalize_merges_rows_of_the_same_person(tmp_path, monkeypatch):
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_dir", tmp_path)
+    monkeypatch.setattr(evidence_index.settings, "scraper_cache_dir", tmp_path)
+
+    fetched_titles = []
+
+    def fake_fetch_pages_batch(titles, run_id, force=False, revalidate=False):
+        fetched_titles.extend(titles)
+        return [_parse_response(t, PERSON_HTML, 700) for t in titles]
+
+    parse_calls = []
+    real_parse_person_page = person_page.parse_person_page
+
+    def counting_parse_person_page(response):
+        parse_calls.append(response.page_title)
+        return real_parse_person_page(response)
+
+    monkeypatch.setattr(mediawiki_cache, "fetch_pages_batch", fake_fetch_pages_batch)
+    monkeypatch.setattr(person_page, "parse_person_page", counting_parse_person_page)
+
+    response = _parse_response("Test Page Dup", HTML, 500)
+    legislature_data = parse_legislature_members(response, "nds_lt_dup", seed_data=SEED_DATA)
+    assert len(legislature_data.members) == 2
+
+    normalized = PipelineRunner(get_settings())._normalize(
+        legislature_data, SEED_DATA, response, run_id="run-dup", fetch_person_pages=True
+    )
+
+    assert fetched_titles == ["Anna_Beispiel"]
+    assert parse_calls == ["Anna_Beispiel"]
+    assert len(normalized["persons"]) == 1
+    assert len(normalized["mandates"]) == 2
+
+    person = normalized["persons"][0]
+    assert person.intro == "Anna Beispiel ist eine Politikerin."
+    row_indexes = sorted(
+        ref.snippet_ref["row_index"] for ref in person.evidence_refs if ref.purpose == "membership_row"
+    )
+    assert row_indexes == [0, 1]
@@ -0,0 +1,51 @@
+from scraper.config import get_settings
+from scraper.mediawiki.types import MediaWikiParseResponse
+from scraper.pipeline.run import PipelineRunner, _make_parse_pool
+
+HTML = """
+<table class="wikitable">
+<tr><th>Name</th><th>Partei</th><th>Wahlkreis</th><th>Anmerkungen</th></tr>
+<tr><td><a href="/wiki/Anna_Beispiel" title="Anna Beispiel">Anna Beispiel</a></td><td>SPD</td><td>Hannover</td><td></td></tr>
+<tr><td><a href="/wiki/Bernd_Muster" title="Bernd Muster">Bernd Muster</a></td><td>CDU</td><td>Celle</td><td>nachgerückt</td></tr>
+</table>
+"""
+
+SEED_DATA = {
+    "key": "nds_lt_pp",
+    "page_title": "Test Page PP",
+    "expected_time_range": {"start": "2017-11-14", "end": "2022-11-07"},
+    "hints": {"parliament": "Niedersächsischer Landtag", "state": "Niedersachsen", "legislature_number": 18},
+}
+
+
+def _without_created_at(value):
+    """Drop EvidenceRef timestamps, which differ between two parses."""
+    if isinstance(value, dict):
+        return {k: _without_created_at(v) for k, v in value.items() if k != "created_at"}
+    if isinstance(value, (list, tuple)):
+        return [_without_created_at(v) for v in value]
+    return value
+
+
+def test_parse_members_in_worker_processes_matches_in_thread():
+    response = MediaWikiParseResponse(
+        parse={"pageid": 4242, "revid": 4343, "title": "Test Page PP", "text": {"*": HTML}},
+        page_id=4242,
+        revision_id=4343,
+        page_title="Test Page PP",
+        html=HTML,
+        displaytitle="Test Page PP",
+    )
+    runner = PipelineRunner(get_settings())
+
+    in_thread = runner._parse_members(response, "nds_lt_pp", SEED_DATA)
+
+    runner._parse_pool = _make_parse_pool(2)
+    try:
+        in_process = runner._parse_members(response, "nds_lt_pp", SEED_DATA)
+    finally:
+        runner._parse_pool.shutdown()
+        runner._parse_pool = None
+
+    assert len(in_process.members) == 2
+    assert _without_created_at(in_process.model_dump()) == _without_created_at(in_thread.model_dump())
@@ -0,0 +1,37 @@
+import httpx
+import pytest
+
+from scraper.utils.ratelimit import (
+    MAX_RETRY_AFTER_SECONDS,
+    TokenBucket,
+    _is_retryable,
+    _retry_after_seconds,
+)
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    """Test that a full bucket serves `capacity` requests at once, then one per 1/rate seconds."""
+    bucket = TokenBucket(rate=2.0, capacity=3)
+
+    waits = [bucket.reserve() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.5, abs=0.05)
+    assert waits[4] == pytest.approx(1.0, abs=0.05)
+
+
+def test_retry_after_is_honored_for_rate_limited_responses():
+    """Test that Retry-After of a 429 is read, and that client errors are not retried."""
+    request = httpx.Request("GET", "https://de.wikipedia.org/w/api.php")
+
+    def status_error(status: int, headers: dict) -> httpx.HTTPStatusError:
+        response = httpx.Response(status, headers=headers, request=request)
+        return httpx.HTTPStatusError("error", request=request, response=response)
+
+    assert _retry_after_seconds(status_error(429, {"Retry-After": "7"})) == 7.0
+    assert _retry_after_seconds(status_error(429, {"Retry-After": "3600"})) == MAX_RETRY_AFTER_SECONDS
+    assert _retry_after_seconds(status_error(500, {"Retry-After": "7"})) is None
+
+    assert _is_retryable(status_error(503, {}))
+    assert _is_retryable(httpx.ConnectError("refused", request=request))
+    assert not _is_retryable(status_error(404, {}))
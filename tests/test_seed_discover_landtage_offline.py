@@ -1,3 +1,4 @@
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -77,6 +78,7 @@ async def test_discover_landtage_seeds_offline():
     
     with patch("scraper.seeds.discover_landtage.get_client") as mock_client:
         client_mock = AsyncMock()
+        client_mock.__aenter__.return_value = client_mock
         mock_client.return_value = client_mock
         
         # Mock search
@@ -87,6 +89,9 @@ async def test_discover_landtage_seeds_offline():
         
         # Mock parse
         client_mock.fetch_parse = AsyncMock(return_value=parse_fixture)
+        client_mock.fetch_parse_many = AsyncMock(
+            side_effect=lambda titles, **kwargs: [parse_fixture for _ in titles]
+        )
         
         # Mock cache paths to return non-existent (force fetch)
         with patch("scraper.seeds.discover_landtage.settings") as mock_settings:
@@ -116,3 +121,78 @@ async def test_discover_landtage_seeds_offline():
                 assert "hints" in seed_data
                 assert seed_data["hints"]["legislature_number"] is not None
 
+
+
+class _DiscoveryClient:
+    """Fake MediaWiki client: one existing member list page, one missing page."""
+
+    BASE_URL = "https://de.wikipedia.org/w/api.php"
+
+    def __init__(self, existing_title, missing_title):
+        self.existing_title = existing_title
+        self.missing_title = missing_title
+        self.parse_requests = []
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        self.closed = True
+
+    async def fetch_search(self, query, limit=50):
+        titles = [self.existing_title, self.missing_title]
+        return {"query": {"search": [{"title": t, "snippet": ""} for t in titles]}}
+
+    async def fetch_query(self, title):
+        if title == self.existing_title:
+            return {"query": {"pages": {"1": {"pageid": 1, "revisions": [{"revid": 10}]}}}}
+        return {"query": {"pages": {"-1": {"missing": ""}}}}
+
+    async def fetch_parse_many(self, titles, include_sections=False, concurrency=None):
+        self.parse_requests.extend(titles)
+        html = (
+            "<table><tr><th>Name</th><th>Partei</th></tr>"
+            "<tr><td>Person 1</td><td>CDU</td></tr></table>"
+        )
+        return [{"parse": {"pageid": 1, "revid": 10, "text": {"*": html}}} for _ in titles]
+
+    async def fetch_parse(self, title, include_sections=False):
+        return (await self.fetch_parse_many([title]))[0]
+
+
+def test_discover_landtage_seeds_fetches_parse_only_for_existing_pages(tmp_path, monkeypatch):
+    """Titles rejected by the page info query do not get their parse responses fetched."""
+    import scraper.cache.mediawiki_cache as mediawiki_cache
+    import scraper.seeds.discover_landtage as discover
+
+    registry_path = tmp_path / "registry.yaml"
+    registry_path.write_text(
+        "version: 1\n"
+        "landtage:\n"
+        "  nds:\n"
+        "    key_prefix: nds_lt_\n"
+        "    state: Niedersachsen\n"
+        "    parliament: Niedersächsischer Landtag\n"
+        "    wikipedia_index_title: Niedersächsischer Landtag\n"
+        "    member_list_search: ['intitle:Liste']\n",
+        encoding="utf-8",
+    )
+    client = _DiscoveryClient("Liste (17. Wahlperiode)", "Liste (18. Wahlperiode)")
+    monkeypatch.setattr(discover, "get_client", lambda: client)
+    monkeypatch.setattr(discover.settings, "scraper_cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(mediawiki_cache.settings, "scraper_cache_dir", tmp_path / "cache")
+
+    manifest = asyncio.run(
+        discover.discover_landtage_seeds(
+            registry_path=registry_path, output_path=tmp_path / "seeds.yaml", force=True
+        )
+    )
+
+    assert client.parse_requests == ["Liste (17. Wahlperiode)"]
+    assert client.closed
+    assert manifest["seed_count"] == 1
+    assert manifest["rejected"] == [{"title": "Liste (18. Wahlperiode)", "reason": "Page not found"}]